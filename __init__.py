@@ -1,7 +1,24 @@
 from .molecule import Molecule
 from .min import MIN, read_min
 from .lup_ts import LUPTS, read_lup_ts
-from .eq_list import EQList, read_eq_list
-from .pt_list import PTList, read_pt_list
+from .eq_list import EQList, EQListFollower, iter_eq_list, read_eq_list
+from .pt_list import PTList, PTListFollower, iter_pt_list, read_pt_list
 from .reaction_path_network import ReactionPathNetwork
-from .geometry import get_adj_matrix, get_distance
\ No newline at end of file
+from .graph import ReactionGraph
+from .geometry import (
+    get_adj_matrix,
+    get_angles,
+    get_bonds,
+    get_bonds_batch,
+    get_dihedral_angles,
+    get_distance,
+    get_distances,
+    get_wilson_b_matrix,
+)
+from .job import GRRMJob, load_job, load_jobs
+from .cache import ParseCache, disable_cache, enable_cache, get_cache
+from .archive import load, save
+from .alignment import align, get_rmsd, get_rmsd_matrix
+from .similarity import FingerprintIndex, get_fingerprints
+from .kinetics import Kinetics, eyring_rates
+from .paths import PathIndex
\ No newline at end of file
@@ -0,0 +1,16 @@
+class _Archived:
+    """
+    save and load of the memory-mappable archive directories of grrmlib.archive.
+    """
+    
+    def save(self, path):
+        """
+        Save to a memory-mappable archive directory, see grrmlib.archive.
+        """
+        from .archive import save
+        save(self, path)
+    
+    @classmethod
+    def load(cls, path, mmap=True):
+        from .archive import _load_as
+        return _load_as(cls, path, mmap)
@@ -0,0 +1,17 @@
+def _iter_blocks(f):
+    """
+    Yield the lines of each block headed by a line starting with "#".
+    Lines before the first header are skipped. Only one block is held in memory at a time.
+    """
+    block = None
+    
+    for line in f:
+        if line.startswith("#"):
+            if block is not None:
+                yield block
+            block = [line]
+        elif block is not None:
+            block.append(line)
+    
+    if block is not None:
+        yield block
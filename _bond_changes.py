@@ -0,0 +1,31 @@
+import numpy as np
+
+
+def _bond_changes(pairs, offsets, n_atoms, before, after):
+    """
+    Bonds formed and broken from structure before[e] to structure after[e], for all e at once.
+    pairs and offsets are the bonds of the structures as returned by get_bonds_batch.
+    Returns e, the atom indices i < j (0-based) and the change (1 formed, -1 broken), sorted by e, i and j.
+    """
+    # Bond (i, j) of step e is encoded as one integer, so that set differences give the changes of all steps.
+    codes_before = _gather(pairs, offsets, n_atoms, np.asarray(before, dtype=np.int64))
+    codes_after = _gather(pairs, offsets, n_atoms, np.asarray(after, dtype=np.int64))
+    formed = np.setdiff1d(codes_after, codes_before, assume_unique=True)
+    broken = np.setdiff1d(codes_before, codes_after, assume_unique=True)
+    
+    codes = np.concatenate([formed, broken])
+    change = np.concatenate([np.ones(len(formed), dtype=np.int8), -np.ones(len(broken), dtype=np.int8)])
+    order = np.argsort(codes, kind="stable")
+    step, pair = np.divmod(codes[order], n_atoms * n_atoms)
+    i, j = np.divmod(pair, n_atoms)
+    return step, i, j, change[order]
+
+
+def _gather(pairs, offsets, n_atoms, structures):
+    """
+    Codes step * n_atoms**2 + i * n_atoms + j of the bonds of structures[step].
+    """
+    counts = np.diff(offsets)[structures]
+    step = np.repeat(np.arange(len(structures), dtype=np.int64), counts)
+    rows = np.repeat(offsets[structures] - (np.cumsum(counts) - counts), counts) + np.arange(counts.sum())
+    return (step * n_atoms + pairs[rows, 0]) * n_atoms + pairs[rows, 1]
@@ -0,0 +1,69 @@
+import networkx as nx
+import numpy as np
+
+
+_GOLDEN = np.uint64(0x9E3779B97F4A7C15)
+
+
+def _mix(x):
+    """
+    splitmix64 finalizer, applied elementwise to a uint64 array.
+    """
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+
+def _wl_hashes(z, node_offsets, pairs, iterations=3):
+    """
+    Weisfeiler-Lehman hashes of element-labelled graphs, one uint64 per graph.
+    The graphs are concatenated: nodes node_offsets[k]:node_offsets[k + 1] belong to graph k,
+    z holds their atomic numbers and pairs the bonds as global node indices.
+    Neighbour labels are combined by a wrapping sum, so each iteration is a few passes over all graphs at once.
+    """
+    n_graphs = len(node_offsets) - 1
+    graph_of_node = np.repeat(np.arange(n_graphs), np.diff(node_offsets))
+    
+    with np.errstate(over="ignore"):
+        labels = _mix(np.asarray(z, dtype=np.uint64) + _GOLDEN)
+        hashes = np.zeros(n_graphs, dtype=np.uint64)
+        np.add.at(hashes, graph_of_node, _mix(labels))
+    
+        for iteration in range(1, iterations + 1):
+            neighbours = np.zeros(len(labels), dtype=np.uint64)
+            np.add.at(neighbours, pairs[:, 0], _mix(labels[pairs[:, 1]]))
+            np.add.at(neighbours, pairs[:, 1], _mix(labels[pairs[:, 0]]))
+            labels = _mix(labels * _GOLDEN + neighbours)
+            np.add.at(hashes, graph_of_node, _mix(labels ^ np.uint64(iteration)))
+    
+    return hashes
+
+
+def _group_keys(keys):
+    """
+    Returns lists of positions with equal keys, in order of first appearance.
+    """
+    groups = {}
+    for i, key in enumerate(keys):
+        groups.setdefault(key, []).append(i)
+    return list(groups.values())
+
+
+def _split_isomorphic(positions, graph):
+    """
+    Splits one hash bucket into classes of isomorphic graphs. graph(i) returns the networkx graph of position i.
+    """
+    classes = []
+    for i in positions:
+        G = graph(i)
+        for representative, members in classes:
+            if nx.is_isomorphic(G, representative, node_match=_same_element):
+                members.append(i)
+                break
+        else:
+            classes.append((G, [i]))
+    return [members for _, members in classes]
+
+
+def _same_element(a, b):
+    return a["z"] == b["z"]
@@ -0,0 +1,91 @@
+import os
+from abc import ABC, abstractmethod
+
+from .molecule import _check_fields
+
+
+class _ListFollower(ABC):
+    """
+    Incremental reader of a list file that is still being written.
+    The byte offset after the last parsed block is remembered, so each poll only parses new blocks.
+    """
+    
+    # Bytes before the offset that are checked to detect that the file has been rewritten.
+    mark_size = 64
+    
+    def __init__(self, path, fields=None):
+        self.path = path
+        self._fields = _check_fields(fields)
+        self.offset = 0
+        self.molecules = []
+        self._mark = b""
+    
+    def poll(self, final=False):
+        """
+        Parse the blocks completed since the last call and return their molecules.
+        The last block of the file is only parsed once it is complete (or with final=True when the run has finished),
+        so a partially written block is picked up by a later poll.
+        If the file has been rewritten, reading restarts from the beginning and all molecules are returned again.
+        """
+        if os.path.getsize(self.path) < self.offset:
+            self._reset()
+        
+        with open(self.path, "rb") as f:
+            f.seek(self.offset - len(self._mark))
+            data = f.read()
+        
+        if not data.startswith(self._mark):
+            self._reset()
+            return self.poll(final=final)
+        
+        buffer = data
+        data = data[len(self._mark):]
+        if not final:
+            data = data[:data.rfind(b"\n") + 1]
+        
+        headers = _header_offsets(data)
+        ends = headers[1:] + [len(data)]
+        consumed = 0
+        molecules = []
+        
+        for k, (start, end) in enumerate(zip(headers, ends)):
+            lines = data[start:end].decode().splitlines(keepends=True)
+            if k == len(headers) - 1 and not (final or self._complete(lines)):
+                consumed = start
+                break
+            molecules.append(self._read_block(lines))
+            consumed = end
+        
+        self.offset += consumed
+        end = len(self._mark) + consumed
+        self._mark = buffer[max(0, end - self.mark_size):end]
+        self.molecules += molecules
+        return molecules
+    
+    def _reset(self):
+        self.offset = 0
+        self.molecules = []
+        self._mark = b""
+    
+    def _complete(self, lines):
+        """
+        Whether the last block of the file is completely written.
+        """
+        return False
+    
+    @abstractmethod
+    def _read_block(self, lines):
+        """
+        Parse the lines of one block of the list file into a Molecule.
+        """
+
+
+def _header_offsets(data):
+    offsets = [0] if data.startswith(b"#") else []
+    pos = data.find(b"\n#")
+    
+    while pos >= 0:
+        offsets.append(pos + 1)
+        pos = data.find(b"\n#", pos + 1)
+    
+    return offsets
@@ -0,0 +1,128 @@
+import base64
+import json
+
+import numpy as np
+
+
+_HEAD = """<html>
+<head>
+<meta charset="utf-8">
+<link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/vis-network/9.1.2/dist/dist/vis-network.min.css" type="text/css" />
+<script src="https://cdnjs.cloudflare.com/ajax/libs/vis-network/9.1.2/dist/vis-network.min.js"></script>
+<style type="text/css">
+html, body, #mynetwork {width: 100%; height: 100%; margin: 0;}
+</style>
+</head>
+<body>
+<div id="mynetwork"></div>
+<script type="text/javascript">
+"""
+
+_TAIL = """var network = new vis.Network(document.getElementById("mynetwork"), {nodes: nodes, edges: edges}, options);
+</script>
+</body>
+</html>
+"""
+
+# Same look as to_html, with the curve of the first edge between two EQs as the default,
+# and no layout pass, since every node has a position.
+_OPTIONS = {
+    "edges": {"arrows": {"to": {"enabled": False}}, "smooth": {"enabled": True, "type": "curvedCW", "roundness": 0.1}},
+    "nodes": {"shape": "dot", "size": 5},
+    "interaction": {"dragNodes": True, "hideEdgesOnDrag": False, "hideNodesOnDrag": False},
+    "layout": {"improvedLayout": False},
+    "physics": {"enabled": False},
+}
+
+_NODE = '{"id": %s, "label": %s, "title": %s, "x": %.2f, "y": %.2f, "color": "#%02x%02x%02x"}'
+_EDGE = '{"from": %s, "to": %s, "label": %s, "title": %s, "color": "#%02x%02x%02x"%s}'
+
+# Typed arrays are decoded from base64 and expanded into the vis.js items in the browser.
+_DECODE = """function decode(text, type) {
+    var bytes = Uint8Array.from(atob(text), function (c) { return c.charCodeAt(0); });
+    return new type(bytes.buffer);
+}
+function rgb(colors, i) {
+    return "rgb(" + colors[3 * i] + "," + colors[3 * i + 1] + "," + colors[3 * i + 2] + ")";
+}
+"""
+
+_EXPAND = """var nodeItems = new Array(names.length);
+for (var i = 0; i < names.length; i++) {
+    nodeItems[i] = {id: i, label: names[i], title: names[i], x: x[i], y: y[i], color: rgb(nodeColors, i)};
+}
+var edgeItems = new Array(tsNames.length);
+for (var e = 0; e < tsNames.length; e++) {
+    edgeItems[e] = {from: source[e], to: target[e], label: tsNames[e], title: tsNames[e], color: rgb(edgeColors, e)};
+    if (parallel[e] > 0) {
+        edgeItems[e].smooth = {roundness: 0.1 + 0.1 * parallel[e]};
+    }
+}
+var nodes = new vis.DataSet(nodeItems.concat(extraNodes));
+var edges = new vis.DataSet(edgeItems);
+"""
+
+# Nodes and edges are formatted and written in chunks through a large buffer.
+_BUFFER_SIZE = 1 << 20
+_CHUNK = 1 << 14
+
+
+def _write_html(path, names, xy, colors, ts_names, source, target, edge_colors, parallel, extra_nodes=(), compact=False):
+    """
+    Write a vis.js page of a network in one pass.
+    names, xy (n, 2) and colors (n, 3) uint8 describe the nodes; ts_names, source and target (node ids),
+    edge_colors and parallel (the number of earlier edges between the same two nodes) the edges.
+    extra_nodes are vis.js node dicts added as they are, e.g. group labels.
+    With compact=True, the numbers are embedded as base64 typed arrays and the items are built in the browser.
+    """
+    with open(path, "w", buffering=_BUFFER_SIZE) as f:
+        f.write(_HEAD)
+        f.write(f"var options = {json.dumps(_OPTIONS)};\n")
+        if compact:
+            f.write(_DECODE)
+            f.write(f"var names = {json.dumps(list(names))};\n")
+            f.write(f"var tsNames = {json.dumps(list(ts_names))};\n")
+            f.write(f"var extraNodes = {json.dumps(list(extra_nodes))};\n")
+            for name, array, js_type in (
+                ("x", xy[:, 0].astype("<f4"), "Float32Array"),
+                ("y", xy[:, 1].astype("<f4"), "Float32Array"),
+                ("nodeColors", colors.astype(np.uint8), "Uint8Array"),
+                ("source", source.astype("<i4"), "Int32Array"),
+                ("target", target.astype("<i4"), "Int32Array"),
+                ("edgeColors", edge_colors.astype(np.uint8), "Uint8Array"),
+                ("parallel", np.minimum(parallel, 255).astype(np.uint8), "Uint8Array"),
+            ):
+                encoded = base64.b64encode(np.ascontiguousarray(array).tobytes()).decode("ascii")
+                f.write(f'var {name} = decode("{encoded}", {js_type});\n')
+            f.write(_EXPAND)
+        else:
+            quoted = [json.dumps(name) for name in names]
+            f.write("var nodes = new vis.DataSet([\n")
+            _write_items(f, _NODE, (
+                (name, name, name, x, y, *color)
+                for name, (x, y), color in zip(quoted, xy.tolist(), colors.tolist())
+            ))
+            f.write("".join(json.dumps(node) + ",\n" for node in extra_nodes))
+            f.write("]);\nvar edges = new vis.DataSet([\n")
+            _write_items(f, _EDGE, (
+                (quoted[i], quoted[j], label, label, *color, f', "smooth": {{"roundness": {0.1 + 0.1 * k:.1f}}}' if k else "")
+                for i, j, label, color, k in zip(
+                    source.tolist(), target.tolist(), map(json.dumps, ts_names), edge_colors.tolist(), parallel.tolist()
+                )
+            ))
+            f.write("]);\n")
+        f.write(_TAIL)
+
+
+def _write_items(f, template, rows):
+    """
+    Write the rows formatted with template as JSON array items, one per line, _CHUNK rows at a time.
+    """
+    chunk = []
+    for row in rows:
+        chunk.append(template % row)
+        if len(chunk) == _CHUNK:
+            f.write(",\n".join(chunk) + ",\n")
+            chunk = []
+    if chunk:
+        f.write(",\n".join(chunk) + ",\n")
@@ -0,0 +1,101 @@
+import mmap
+import os
+import re
+
+import numpy as np
+
+
+_HEADER_NUMBER = re.compile(rb"(\d+),")
+
+
+def _index_path(path):
+    return f"{path}.idx.npz"
+
+
+class _BlockIndex:
+    """
+    Byte offsets of the "#" headers of a list file.
+    Blocks are read on demand through mmap.
+    """
+    
+    def __init__(self, path, offsets, numbers):
+        self.path = path
+        self.offsets = offsets  # len(numbers) + 1 entries, the last one is the file size
+        self.numbers = numbers
+        self._file = None
+        self._mmap = None
+    
+    def __len__(self):
+        return len(self.numbers)
+    
+    def __del__(self):
+        self.close()
+    
+    @classmethod
+    def open(cls, path):
+        """
+        Load the sidecar index if it matches the file size and mtime, otherwise rebuild and save it.
+        """
+        stat = os.stat(path)
+        
+        try:
+            with np.load(_index_path(path)) as npz:
+                if int(npz["size"]) == stat.st_size and int(npz["mtime"]) == stat.st_mtime_ns:
+                    return cls(path, npz["offsets"], npz["numbers"])
+        except (OSError, KeyError, ValueError):
+            pass
+        
+        offsets, numbers = _scan_headers(path)
+        
+        try:
+            with open(_index_path(path), "wb") as f:
+                np.savez(f, offsets=offsets, numbers=numbers, size=stat.st_size, mtime=stat.st_mtime_ns)
+        except OSError:
+            pass
+        
+        return cls(path, offsets, numbers)
+    
+    def lines(self, i):
+        if self._mmap is None:
+            self._file = open(self.path, "rb")
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._mmap[self.offsets[i]:self.offsets[i + 1]].decode().splitlines(keepends=True)
+    
+    def close(self):
+        if self._mmap is not None:
+            self._mmap.close()
+            self._file.close()
+            self._mmap = None
+            self._file = None
+
+
+def _scan_headers(path):
+    """
+    Find the byte offset and number of every "#" header line.
+    """
+    offsets = []
+    numbers = []
+    
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return np.zeros(1, dtype=np.int64), np.zeros(0, dtype=np.int64)
+        
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            pos = 0 if mm[:1] == b"#" else _next_header(mm, 0)
+            
+            while pos >= 0:
+                end = mm.find(b"\n", pos)
+                end = size if end < 0 else end
+                m = _HEADER_NUMBER.search(mm[pos:end])
+                offsets.append(pos)
+                numbers.append(int(m.group(1)) if m else -1)
+                pos = _next_header(mm, end)
+    
+    offsets.append(size)
+    return np.array(offsets, dtype=np.int64), np.array(numbers, dtype=np.int64)
+
+
+def _next_header(mm, start):
+    pos = mm.find(b"\n#", start)
+    return pos + 1 if pos >= 0 else -1
\ No newline at end of file
@@ -0,0 +1,311 @@
+from abc import ABC, abstractmethod
+
+import networkx as nx
+import numpy as np
+
+from .alignment import get_rmsd
+from .data import symbols_to_z
+from .geometry import get_bonds, get_bonds_batch
+from .similarity import FingerprintIndex
+from ._archived import _Archived
+from ._connectivity import _group_keys, _split_isomorphic, _wl_hashes
+from ._index import _BlockIndex
+from ._store import MoleculeStore, _in_store
+
+
+class _MoleculeList(_Archived, ABC):
+    """
+    Common container behaviour of EQList and PTList.
+    Molecules are held in a list, in a columnar MoleculeStore, or parsed on demand from an indexed file.
+    In the last two cases the items are built on access, so changes to them are not kept:
+    change the structures through molecules, which holds them in a list from then on.
+    """
+    
+    prefix = None
+    
+    def __init__(self, name=None, molecules=None, index=None, store=None, fields=None):
+        self.name = name
+        self._molecules = molecules
+        self._index = index
+        self._store = store
+        self._fields = fields
+        self._positions = None
+        self._column_store = None
+    
+    @classmethod
+    def from_index(cls, path, fields=None):
+        return cls(name=path, index=_BlockIndex.open(path), fields=fields)
+    
+    @classmethod
+    def from_molecules(cls, molecules, name=None):
+        """
+        Store the molecules in columns if they share the same atoms, otherwise keep the list.
+        """
+        try:
+            return cls(name=name, store=MoleculeStore.from_molecules(molecules))
+        except ValueError:
+            return cls(name=name, molecules=molecules)
+    
+    @property
+    def molecules(self):
+        """
+        The list of molecules. A list in columns or an indexed file is read into memory on first access
+        and held as this list from then on, so that appending to it or changing its molecules is kept.
+        """
+        if self._molecules is None and (self._store is not None or self._index is not None):
+            self.molecules = list(self)
+        return self._molecules
+    
+    @molecules.setter
+    def molecules(self, molecules):
+        self._molecules = molecules
+        self._store = None
+        self._positions = None
+        self._column_store = None
+    
+    @property
+    def store(self):
+        """
+        Columnar store of the structures. Reading it does not change how the list is held: for a list in memory
+        it is built on every access, so it follows changes to molecules, and for an indexed file it is built once.
+        Raises ValueError if the structures do not share the same atoms.
+        """
+        store = self._columns()
+        if store.coords is None:
+            raise ValueError("Molecules with different atoms cannot be stored in columns.")
+        return store
+    
+    def _columns(self, coords=True):
+        """
+        Like store, but with coords=False a list in memory only gets the columns other than symbols and coords,
+        which needs no shared atoms, and the columns of an indexed file whose atoms differ are built without them.
+        """
+        if self._store is not None:
+            return self._store
+        if self._molecules is None and self._index is not None:
+            if self._column_store is None:
+                molecules = list(self)
+                try:
+                    self._column_store = MoleculeStore.from_molecules(molecules)
+                except ValueError:
+                    self._column_store = MoleculeStore.from_molecules(molecules, coords=False)
+            return self._column_store
+        return MoleculeStore.from_molecules(list(self), coords)
+    
+    @property
+    def names(self):
+        return self._columns(coords=False).names
+    
+    @property
+    def symbols(self):
+        return self.store.symbols
+    
+    @property
+    def coords(self):
+        return self.store.coords
+    
+    @property
+    def energies(self):
+        return self._columns(coords=False).scfenergy
+    
+    @property
+    def afir_energies(self):
+        return self._columns(coords=False).afirenergy
+    
+    @property
+    def zpves(self):
+        return self._columns(coords=False).zpve
+    
+    @property
+    def mults(self):
+        return self._columns(coords=False).mult
+    
+    @property
+    def nmeigen(self):
+        """
+        Returns the concatenated eigenvalues and the offsets of each structure.
+        """
+        store = self._columns(coords=False)
+        return store.nmeigen, store.nmeigen_offsets
+    
+    def bonds(self, threshold=1.25):
+        """
+        Returns the concatenated bonded atom pairs of all structures and the offsets of each structure.
+        Structures with the same atoms are searched as one coordinate stack.
+        """
+        try:
+            store = self.store
+        except ValueError:
+            store = None
+        if store is not None:
+            return get_bonds_batch(store.symbols, store.coords, threshold)
+        
+        chunks = [get_bonds(molecule.symbols, molecule.atomcoords, threshold) for molecule in self]
+        offsets = np.zeros(len(chunks) + 1, dtype=np.int64)
+        np.cumsum([len(chunk) for chunk in chunks], out=offsets[1:])
+        pairs = np.concatenate(chunks) if chunks else np.empty((0, 2), dtype=np.intp)
+        return pairs, offsets
+    
+    def connectivity_hashes(self, threshold=1.25, iterations=3):
+        """
+        Weisfeiler-Lehman hashes (uint64) of the element-labelled bond graphs.
+        Structures with the same bonding pattern get the same hash, whatever the atom order.
+        """
+        pairs, offsets = self.bonds(threshold)
+        z, node_offsets = self._atomic_numbers()
+        structure = np.repeat(np.arange(len(offsets) - 1), np.diff(offsets))
+        return _wl_hashes(z, node_offsets, pairs + node_offsets[structure, None], iterations)
+    
+    def group_by_connectivity(self, threshold=1.25, method="hash", iterations=3):
+        """
+        Groups the structures by bonding pattern and returns lists of names, in order of first appearance.
+        method is "labelled" (the same bonded atom pairs), "hash" (connectivity_hashes)
+        or "exact" (hash buckets split by a graph isomorphism check).
+        iterations is passed to connectivity_hashes.
+        """
+        if method == "labelled":
+            pairs, offsets = self.bonds(threshold)
+            _, node_offsets = self._atomic_numbers()
+            keys = [
+                (node_offsets[i + 1] - node_offsets[i], pairs[offsets[i]:offsets[i + 1]].tobytes())
+                for i in range(len(offsets) - 1)
+            ]
+            groups = _group_keys(keys)
+        elif method in ("hash", "exact"):
+            groups = _group_keys(self.connectivity_hashes(threshold, iterations).tolist())
+        else:
+            raise ValueError(f"Unknown grouping method: {method}")
+        
+        if method == "exact":
+            pairs, offsets = self.bonds(threshold)
+            z, node_offsets = self._atomic_numbers()
+            
+            def graph(i):
+                G = nx.Graph()
+                G.add_nodes_from((k, {"z": z[node_offsets[i] + k]}) for k in range(node_offsets[i + 1] - node_offsets[i]))
+                G.add_edges_from(pairs[offsets[i]:offsets[i + 1]].tolist())
+                return G
+            
+            groups = [members for group in groups for members in _split_isomorphic(group, graph)]
+            groups.sort(key=lambda members: members[0])
+        
+        names = self._names()
+        return [[names[i] for i in group] for group in groups]
+    
+    def rmsd(self, molecule, permute=False):
+        """
+        RMSDs of all structures from molecule after the Kabsch alignment, e.g. to find the EQ an IRC ends in.
+        With permute=True, atoms of the same element are matched too, so molecule may list its atoms in another order.
+        """
+        store = self.store
+        reference = np.asarray(molecule.atomcoords, dtype=float)
+        if tuple(molecule.symbols) != tuple(store.symbols.tolist()):
+            if not permute or sorted(molecule.symbols) != sorted(store.symbols.tolist()):
+                raise ValueError("The molecule has different atoms from the structures.")
+            order = np.argsort(np.asarray(molecule.symbols), kind="stable")
+            reference = reference[order][np.argsort(np.argsort(store.symbols, kind="stable"))]
+        return get_rmsd(reference, store.coords, store.symbols, permute)
+    
+    def dedupe(self, threshold, rmsd=None, descriptor="coulomb"):
+        """
+        Returns a new list that keeps the lowest-energy structure of each cluster of near duplicates,
+        see FingerprintIndex.clusters for threshold and rmsd.
+        """
+        index = FingerprintIndex(self, descriptor)
+        keep = []
+        for group in index.clusters(threshold, rmsd):
+            energies = [self[i].scfenergy for i in group]
+            energies = [np.inf if energy is None else energy for energy in energies]
+            keep.append(group[int(np.argmin(energies))])
+        return type(self).from_molecules([self[i] for i in sorted(keep)], name=self.name)
+    
+    def extend(self, molecules):
+        """
+        Append molecules. A list in columns stays in columns if the molecules have the same atoms
+        and no fields that the store does not keep; otherwise it is held in memory from then on.
+        """
+        molecules = list(molecules)
+        if self._molecules is None and self._store is not None and _in_store(molecules):
+            try:
+                self._store = self._store.concatenate(MoleculeStore.from_molecules(molecules))
+            except ValueError:
+                pass
+            else:
+                self._positions = None
+                return
+        self.molecules = list(self) + molecules
+    
+    def __len__(self):
+        if self._molecules is None and self._store is not None:
+            return len(self._store)
+        if self._molecules is None and self._index is not None:
+            return len(self._index)
+        return len(self._molecules)
+    
+    def __iter__(self):
+        if self._molecules is None and (self._store is not None or self._index is not None):
+            return (self._get(i) for i in range(len(self)))
+        return iter(self._molecules)
+    
+    def __getitem__(self, item):
+        if isinstance(item, str):
+            item = self.position(item)
+        
+        if self._molecules is not None or (self._store is None and self._index is None):
+            return self._molecules[item]
+        
+        if isinstance(item, slice):
+            return [self._get(i) for i in range(*item.indices(len(self)))]
+        
+        i = item + len(self) if item < 0 else item
+        if not 0 <= i < len(self):
+            raise IndexError("list index out of range")
+        return self._get(i)
+    
+    def position(self, name):
+        """
+        Returns the position of the structure called name, e.g. "EQ12".
+        """
+        if self._molecules is not None or (self._store is None and self._index is None):
+            for i, molecule in enumerate(self._molecules):
+                if molecule.name == name:
+                    return i
+            raise KeyError(name)
+        
+        if self._positions is None:
+            if self._store is not None:
+                names = self._store.names.tolist()
+            else:
+                names = [f"{self.prefix}{num}" for num in self._index.numbers.tolist()]
+            self._positions = {name: i for i, name in enumerate(names)}
+        return self._positions[name]
+    
+    def _names(self):
+        if self._store is not None:
+            return self._store.names.tolist()
+        return [molecule.name for molecule in self]
+    
+    def _atomic_numbers(self):
+        """
+        Returns the atomic numbers of all structures concatenated and the offsets of each structure.
+        """
+        if self._store is not None:
+            n_atoms = len(self._store.symbols)
+            z = np.tile(symbols_to_z(self._store.symbols), len(self._store))
+            return z, np.arange(len(self._store) + 1) * n_atoms
+        
+        z = [symbols_to_z(molecule.symbols) for molecule in self]
+        node_offsets = np.zeros(len(z) + 1, dtype=np.int64)
+        np.cumsum([len(zs) for zs in z], out=node_offsets[1:])
+        return (np.concatenate(z) if z else np.empty(0, dtype=np.intp)), node_offsets
+    
+    def _get(self, i):
+        if self._store is not None:
+            return self._store.molecule(i)
+        return self._read_block(self._index.lines(i))
+    
+    @abstractmethod
+    def _read_block(self, lines):
+        """
+        Parse the lines of one block of the indexed file into a Molecule.
+        """
@@ -0,0 +1,108 @@
+import functools
+
+import numpy as np
+
+
+def _read_floats(lines):
+    """
+    Decode all whitespace-separated numbers in lines into a 1D array in one call.
+    """
+    return np.array("".join(lines).split(), dtype=float)
+
+
+def _read_table(lines):
+    """
+    Decode lines with the same number of numeric columns into a 2D array.
+    """
+    values = _read_floats(lines)
+    return values.reshape(len(lines), -1) if lines else values.reshape(0, 0)
+
+
+def _read_first_column(lines):
+    return _read_table(lines)[:, 0]
+
+
+def _read_coords(lines_coord):
+    """
+    Decode "symbol x y z ..." lines.
+    Returns the symbol column as an array of str and the coordinates as an (n, 3) array.
+    """
+    n = len(lines_coord)
+    if n == 0:
+        return np.array([], dtype=str), np.empty((0, 3))
+    
+    tokens = "".join(lines_coord).split()
+    ncol = len(lines_coord[0].split())
+    
+    if ncol * n != len(tokens) or ncol < 4:
+        tokens = [token for line in lines_coord for token in line.split()[:4]]
+        ncol = 4
+    
+    symbols = np.array(tokens[0::ncol])
+    
+    if ncol == 4:
+        del tokens[0::4]
+        atomcoords = np.array(tokens, dtype=float).reshape(n, 3)
+    else:
+        atomcoords = np.array(tokens, dtype=object).reshape(n, ncol)[:, 1:4].astype(float)
+    
+    return symbols, atomcoords
+
+
+def _read_hessian(lines_hess):
+    """
+    Decode a Hessian printed as a lower triangle in column chunks into packed storage,
+    i.e. the lower triangle in row-major order (element (i, j), i >= j, at i * (i + 1) // 2 + j).
+    """
+    values = _read_floats(lines_hess)
+    dim = _triangle_dim(len(values))
+    width = len(lines_hess[dim - 1].split())
+    packed = np.empty_like(values)
+    packed[_chunk_order(dim, width)] = values
+    return packed
+
+
+@functools.lru_cache(maxsize=16)
+def _chunk_order(dim, width):
+    """
+    Packed positions of the values of a lower triangle printed in chunks of width columns.
+    """
+    positions = []
+    
+    for start in range(0, dim, width):
+        stop = min(start + width, dim)
+        rows, cols = np.tril_indices(dim, m=stop)
+        mask = (rows >= start) & (cols >= start)
+        rows, cols = rows[mask], cols[mask]
+        positions.append(rows * (rows + 1) // 2 + cols)
+    
+    return np.concatenate(positions)
+
+
+@functools.lru_cache(maxsize=16)
+def _tril_indices(dim):
+    return np.tril_indices(dim)
+
+
+def _triangle_dim(size):
+    dim = int((np.sqrt(8 * size + 1) - 1) / 2)
+    if dim * (dim + 1) // 2 != size:
+        raise ValueError(f"{size} values do not form a lower triangle.")
+    return dim
+
+
+def _pack_tril(matrix):
+    matrix = np.asarray(matrix)
+    return matrix[_tril_indices(len(matrix))]
+
+
+def _unpack_tril(packed):
+    """
+    Returns the symmetric matrix of a packed lower triangle.
+    """
+    dim = _triangle_dim(len(packed))
+    rows, cols = _tril_indices(dim)
+    matrix = np.empty((dim, dim), dtype=packed.dtype)
+    matrix[rows, cols] = packed
+    matrix[cols, rows] = packed
+    return matrix
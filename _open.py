@@ -0,0 +1,62 @@
+import bz2
+import gzip
+import io
+import lzma
+import os
+
+
+COMPRESSED_SUFFIXES = (".gz", ".xz", ".lzma", ".bz2", ".zst")
+
+
+def _open_text(path):
+    """
+    Open a text file for reading. Files ending with .gz, .xz, .lzma, .bz2 or .zst are
+    decompressed on the fly while they are read.
+    """
+    path = os.fspath(path)
+    
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt")
+    elif path.endswith((".xz", ".lzma")):
+        return lzma.open(path, "rt")
+    elif path.endswith(".bz2"):
+        return bz2.open(path, "rt")
+    elif path.endswith(".zst"):
+        return io.TextIOWrapper(_open_zstd(path))
+    else:
+        return open(path, "r")
+
+
+def _open_zstd(path):
+    zstd = _zstd()
+    if zstd is None:
+        raise ImportError("Reading .zst files requires Python 3.14 or the zstandard package.")
+    return zstd.open(path, "rb")
+
+
+def _zstd():
+    """
+    Returns the available zstd module (compression.zstd or zstandard), or None.
+    """
+    try:
+        from compression import zstd  # Python 3.14+
+        return zstd
+    except ImportError:
+        pass
+    
+    try:
+        import zstandard
+        return zstandard
+    except ImportError:
+        return None
+
+
+def _is_compressed(path):
+    return os.fspath(path).endswith(COMPRESSED_SUFFIXES)
+
+
+def _strip_compressed_suffix(file_name):
+    for suffix in COMPRESSED_SUFFIXES:
+        if file_name.endswith(suffix):
+            return file_name[:-len(suffix)]
+    return file_name
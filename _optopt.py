@@ -1,111 +1,132 @@
 import re
 
-import numpy as np
+from .molecule import Molecule, _lazy
+from ._numeric import _read_coords, _read_first_column, _read_floats, _read_hessian
 
-from .molecule import Molecule
 
+# States of the OPTOPT reader.
+_SEEK = 0
+_ITR = 1
+_OPTIMIZED = 2
 
-def _read_optopt(lines):
+_OPTIMIZED_MARKERS = (
+    ("energy", "ENERGY"),
+    ("grad", "GRADIENT VECTOR"),
+    ("hess", "HESSIAN MATRIX"),
+    ("nmeigen", "NORMAL MODE EIGENVALUE"),
+)
+
+
+def _read_optopt(lines, fields=None):
     """
     Read OPTOPT section.
+    The lines (any iterable, e.g. an open file) are consumed in a single pass, from the first
+    OPTOPT line up to and including the closing OPTOPT line. The rest is left unread.
+    grads, hessian and nmeigen are decoded on first access, or skipped if not in fields.
     """
-    indices_optopt = [i for i, line in enumerate(lines) if line.startswith("OPTOPT")]
-    indices_lineline = [i for i, line in enumerate(lines) if line.startswith("======")]
-    
-    if indices_lineline:
-        index_lineline = indices_lineline[0]
-        lines_opt = lines[indices_optopt[0]:index_lineline]
-    else:
-        lines_opt = lines[0:-2]
-        
-    indices_itr = [i for i, line in enumerate(lines_opt) if line.startswith("#")]
-    indices_itr.append(len(lines_opt))
+    skip_nmeigen = fields is not None and "nmeigen" not in fields
     molecules_itr = []
+    lines_itr = None
+    marks_itr = {}
+    lines_optimized = None
+    marks_optimized = {}
+    state = _SEEK
     
-    for i, j in zip(indices_itr, indices_itr[1:]):
-        lines_itr = lines_opt[i:j]
-        name = "ITR" + re.search(r"ITR. (\d+)", lines_itr[0]).group(1)
-        index_item = [i for i, line in enumerate(lines_itr) if "Item" in line][0]
-        lines_coord = lines_itr[1:index_item]
-        symbols = [line.split()[0] for line in lines_coord]
-        atomcoords = np.array([list(map(float, line.split()[1:4])) for line in lines_coord])
-        scfenergy = float(re.search(r"\(\s*(-?\d+\.?\d+)\s*:", lines_itr[index_item + 1]).group(1))
-        afirenergy = float(re.search(r"ENERGY\s*(-?\d+\.?\d+)\s*\(", lines_itr[index_item + 1]).group(1))
-        mult = float(re.search(r"Spin\(\*\*2\)\s*(-?\d+\.?\d+)", lines_itr[index_item + 2]).group(1))
-        index_nmeigen = [i for i, line in enumerate(lines_itr) if line.startswith("NORMAL MODE EIGENVALUE")][0]
-        lines_nmeigen = lines_itr[index_nmeigen + 1:]
-        nmeigen = np.concatenate([list(map(float, line.split())) for line in lines_nmeigen])
-        molecule = Molecule(
-            name=name,
-            mult=mult,
-            symbols=symbols,
-            atomcoords=atomcoords,
-            scfenergy=scfenergy,
-            afirenergy=afirenergy,
-            nmeigen=nmeigen,
-        )
-        molecules_itr.append(molecule)
+    for line in lines:
+        if state == _SEEK:
+            if line.startswith("OPTOPT"):
+                state = _ITR
+        
+        elif state == _ITR:
+            if line.startswith("#"):
+                if lines_itr is not None:
+                    molecules_itr.append(_read_itr(lines_itr, marks_itr, fields))
+                lines_itr = [line]
+                marks_itr = {}
+            elif line.startswith("======"):
+                if lines_itr is not None:
+                    molecules_itr.append(_read_itr(lines_itr, marks_itr, fields))
+                lines_optimized = [line]
+                state = _OPTIMIZED
+            elif line.startswith("OPTOPT"):
+                # No optimized structure. The last two lines are the status and this line.
+                if lines_itr is not None and len(lines_itr) > 1:
+                    molecules_itr.append(_read_itr(lines_itr[:-1], marks_itr, fields))
+                return molecules_itr, Molecule(name="Optimized structure", status=line.strip())
+            elif lines_itr is not None:
+                if "item" not in marks_itr and "Item" in line:
+                    marks_itr["item"] = len(lines_itr)
+                elif "nmeigen" not in marks_itr and line.startswith("NORMAL MODE EIGENVALUE"):
+                    marks_itr["nmeigen"] = len(lines_itr)
+                elif skip_nmeigen and "nmeigen" in marks_itr:
+                    continue
+                lines_itr.append(line)
+        
+        elif state == _OPTIMIZED:
+            if line.startswith("OPTOPT"):
+                return molecules_itr, _read_optimized(lines_optimized, marks_optimized, fields)
+            for key, marker in _OPTIMIZED_MARKERS:
+                if key not in marks_optimized and line.startswith(marker):
+                    marks_optimized[key] = len(lines_optimized)
+                    break
+            lines_optimized.append(line)
     
+    raise ValueError("OPTOPT section is not closed.")
+
+
+def _read_itr(lines_itr, marks, fields=None):
     """
-    Read the optimized structure.
+    Read one "# ITR." block.
     """
-    if indices_lineline:
-        lines_optimized = lines[indices_lineline[0]:indices_optopt[1]]
-        index_energy = [i for i, line in enumerate(lines_optimized) if line.startswith("ENERGY")][0]
-        lines_coord = lines_optimized[2:index_energy]
-        symbols = [line.split()[0] for line in lines_coord]
-        atomcoords = np.array([list(map(float, line.split()[1:4])) for line in lines_coord])
-        scfenergy = float(re.search(r"=\s*(-?\d+\.?\d+)\s*", lines_optimized[index_energy]).group(1))
-        mult = float(re.search(r"=\s*(-?\d+\.?\d+)", lines_optimized[index_energy + 1]).group(1))
-        zpve = float(m.group(1)) if (m := re.search(r"=\s*(-?\d+\.?\d+)", lines_optimized[index_energy + 2])) else None
-        index_grad = [i for i, line in enumerate(lines_optimized) if line.startswith("GRADIENT VECTOR")][0]
-        index_hess = [i for i, line in enumerate(lines_optimized) if line.startswith("HESSIAN MATRIX")][0]
-        lines_grad = lines_optimized[index_grad + 1:index_hess]
-        grads = np.array([float(line.split()[0]) for line in lines_grad])
-        index_nmeigen = [i for i, line in enumerate(lines_optimized) if line.startswith("NORMAL MODE EIGENVALUE")][0]
-        
-        # read hessian
-        lines_hess = lines_optimized[index_hess + 1: index_nmeigen]
-        indices_hess_chunk = [i for i, line in enumerate(lines_hess) if len(line) <= 15]
-        indices_hess_chunk.append(len(lines_hess))
-        hesses = []
-        
-        for i, j in zip(indices_hess_chunk, indices_hess_chunk[1:]):
-            lines_hess_chunk = lines_hess[i:j]
-            lines_hess_chunk = [list(map(float, line.split())) for line in lines_hess_chunk]
-            
-            for k in range(len(lines_hess_chunk[-1])):
-                hess = [line[k] for line in lines_hess_chunk[k:]]
-                hesses.append(hess)
-        
-        hess_1d = np.concatenate(hesses)
-        dim = len(hesses[0])
-        hess_2d = np.full((dim, dim), np.nan)
-        hess_2d[np.tril_indices(dim)] = hess_1d[::-1]
-        hess_2d = hess_2d[::-1, ::-1].T
-        
-        lines_nmeigen = lines_optimized[index_nmeigen + 1:-2]
-        nmeigen = np.concatenate([list(map(float, line.split())) for line in lines_nmeigen])
-        
-        status = lines_optimized[-1].strip()
-        molecule_optimized = Molecule(
-            name="Optimized structure",
-            mult=mult,
-            symbols=symbols,
-            atomcoords=atomcoords,
-            scfenergy=scfenergy,
-            zpve=zpve,
-            grads=grads,
-            hessian=hess_2d,
-            nmeigen=nmeigen,
-            status=status,
-        )
-        
-    else:
-        status = lines[-1].strip()
-        molecule_optimized = Molecule(
-            name="Optimized structure",
-            status=status,
-        )
-        
-    return molecules_itr, molecule_optimized
\ No newline at end of file
+    name = "ITR" + re.search(r"ITR. (\d+)", lines_itr[0]).group(1)
+    index_item = marks["item"]
+    lines_coord = lines_itr[1:index_item]
+    symbols, atomcoords = _read_coords(lines_coord)
+    scfenergy = float(re.search(r"\(\s*(-?\d+\.?\d+)\s*:", lines_itr[index_item + 1]).group(1))
+    afirenergy = float(re.search(r"ENERGY\s*(-?\d+\.?\d+)\s*\(", lines_itr[index_item + 1]).group(1))
+    mult = float(re.search(r"Spin\(\*\*2\)\s*(-?\d+\.?\d+)", lines_itr[index_item + 2]).group(1))
+    lines_nmeigen = lines_itr[marks["nmeigen"] + 1:]
+    nmeigen = _lazy(fields, "nmeigen", _read_floats, lines_nmeigen)
+    return Molecule(
+        name=name,
+        mult=mult,
+        symbols=symbols,
+        atomcoords=atomcoords,
+        scfenergy=scfenergy,
+        afirenergy=afirenergy,
+        nmeigen=nmeigen,
+    )
+
+
+def _read_optimized(lines_optimized, marks, fields=None):
+    """
+    Read the optimized structure, from the "======" line up to the closing OPTOPT line.
+    """
+    index_energy = marks["energy"]
+    lines_coord = lines_optimized[2:index_energy]
+    symbols, atomcoords = _read_coords(lines_coord)
+    scfenergy = float(re.search(r"=\s*(-?\d+\.?\d+)\s*", lines_optimized[index_energy]).group(1))
+    mult = float(re.search(r"=\s*(-?\d+\.?\d+)", lines_optimized[index_energy + 1]).group(1))
+    zpve = float(m.group(1)) if (m := re.search(r"=\s*(-?\d+\.?\d+)", lines_optimized[index_energy + 2])) else None
+    index_grad = marks["grad"]
+    index_hess = marks["hess"]
+    lines_grad = lines_optimized[index_grad + 1:index_hess]
+    grads = _lazy(fields, "grads", _read_first_column, lines_grad)
+    index_nmeigen = marks["nmeigen"]
+    hessian = _lazy(fields, "hessian", _read_hessian, lines_optimized[index_hess + 1:index_nmeigen])
+    lines_nmeigen = lines_optimized[index_nmeigen + 1:-2]
+    nmeigen = _lazy(fields, "nmeigen", _read_floats, lines_nmeigen)
+    
+    status = lines_optimized[-1].strip()
+    return Molecule(
+        name="Optimized structure",
+        mult=mult,
+        symbols=symbols,
+        atomcoords=atomcoords,
+        scfenergy=scfenergy,
+        zpve=zpve,
+        grads=grads,
+        hessian=hessian,
+        nmeigen=nmeigen,
+        status=status,
+    )
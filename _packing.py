@@ -0,0 +1,79 @@
+import numpy as np
+
+from .molecule import Molecule
+
+
+_STRINGS = ("name", "functional", "basis_set", "comments", "status")
+_SCALARS = ("charge", "mult", "scfenergy", "afirenergy", "zpve")
+_RAGGED = ("symbols", "atomcoords", "grads", "hessian_packed", "nmeigen")
+
+
+def _pack_molecules(molecules):
+    """
+    Pack the fields of molecules into a flat dict of arrays.
+    Variable-length fields are concatenated with offsets, and None is kept in a mask per field,
+    so the dict can be pickled or saved as a few large buffers.
+    """
+    packed = {"n_molecules": np.array(len(molecules))}
+    
+    for field in _STRINGS:
+        values = [getattr(molecule, field) for molecule in molecules]
+        packed[f"{field}_mask"] = np.array([v is not None for v in values], dtype=bool)
+        packed[field] = np.array(["" if v is None else v for v in values], dtype=str)
+    
+    for field in _SCALARS:
+        values = [getattr(molecule, field) for molecule in molecules]
+        packed[f"{field}_mask"] = np.array([v is not None for v in values], dtype=bool)
+        packed[field] = np.array([np.nan if v is None else v for v in values], dtype=float)
+    
+    for field in _RAGGED:
+        values = [getattr(molecule, field) for molecule in molecules]
+        mask = np.array([v is not None for v in values], dtype=bool)
+        counts = np.array([0 if v is None else len(v) for v in values], dtype=np.int64)
+        offsets = np.zeros(len(values) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        parts = [np.asarray(v) for v in values if v is not None]
+        
+        packed[f"{field}_mask"] = mask
+        packed[f"{field}_offsets"] = offsets
+        packed[field] = np.concatenate(parts) if parts else np.empty((0, 3) if field == "atomcoords" else 0)
+    
+    values = [molecule.connection for molecule in molecules]
+    packed["connection_mask"] = np.array([v is not None for v in values], dtype=bool)
+    packed["connection"] = np.array([("", "") if v is None else v for v in values], dtype=str).reshape(-1, 2)
+    
+    return packed
+
+
+def _unpack_molecules(packed):
+    """
+    Rebuild molecules from _pack_molecules. Array fields are views into the packed buffers.
+    """
+    n = int(packed["n_molecules"])
+    columns = {}
+    
+    for field in _STRINGS:
+        mask = packed[f"{field}_mask"]
+        values = packed[field].tolist()
+        columns[field] = [v if m else None for v, m in zip(values, mask)]
+    
+    for field in _SCALARS:
+        mask = packed[f"{field}_mask"]
+        values = packed[field].tolist()
+        columns[field] = [v if m else None for v, m in zip(values, mask)]
+    columns["charge"] = [None if v is None else int(v) for v in columns["charge"]]
+    
+    for field in _RAGGED:
+        mask = packed[f"{field}_mask"]
+        offsets = packed[f"{field}_offsets"]
+        flat = packed[field]
+        columns[field] = [flat[i:j] if m else None for i, j, m in zip(offsets[:-1], offsets[1:], mask)]
+    
+    mask = packed["connection_mask"]
+    columns["connection"] = [tuple(v) if m else None for v, m in zip(packed["connection"].tolist(), mask)]
+    
+    hessian = columns.pop("hessian_packed")
+    return [
+        Molecule(hessian=hessian[i], **{field: values[i] for field, values in columns.items()})
+        for i in range(n)
+    ]
@@ -0,0 +1,198 @@
+import numpy as np
+
+from .molecule import Molecule, _Lazy
+
+
+class MoleculeStore:
+    """
+    Columnar (struct-of-arrays) storage of the structures of an EQ/TS list.
+    All structures share one atom ordering: coordinates are an (n_structures, n_atoms, 3) tensor,
+    the scalar fields are contiguous arrays (NaN for missing values) and nmeigen is a ragged buffer
+    with offsets. nmeigen may also be given as a list of per-structure arrays or lazy fields, which is
+    only decoded into the buffer on first access.
+    """
+    
+    def __init__(
+        self,
+        names,
+        symbols,
+        coords,
+        scfenergy,
+        afirenergy,
+        zpve,
+        mult,
+        nmeigen,
+        nmeigen_offsets,
+        connection=None,
+    ):
+        self.names = names
+        self.symbols = symbols
+        self.coords = coords
+        self.scfenergy = scfenergy
+        self.afirenergy = afirenergy
+        self.zpve = zpve
+        self.mult = mult
+        self._nmeigen = nmeigen
+        self._nmeigen_offsets = nmeigen_offsets
+        self.connection = connection
+        self._symbols = None if symbols is None else tuple(symbols.tolist())
+    
+    def __len__(self):
+        return len(self.names)
+    
+    @property
+    def nmeigen(self):
+        if isinstance(self._nmeigen, list):
+            self._decode_nmeigen()
+        return self._nmeigen
+    
+    @property
+    def nmeigen_offsets(self):
+        if isinstance(self._nmeigen, list):
+            self._decode_nmeigen()
+        return self._nmeigen_offsets
+    
+    @classmethod
+    def from_molecules(cls, molecules, coords=True):
+        """
+        Raises ValueError if the molecules do not share the same symbols.
+        With coords=False, symbols and coords are None and only the other columns are filled,
+        which works for any molecules.
+        """
+        symbols = molecules[0].symbols if molecules else []
+        if coords and any(list(molecule.symbols) != list(symbols) for molecule in molecules):
+            raise ValueError("Molecules with different atoms cannot be stored in columns.")
+        
+        nmeigen = [molecule._nmeigen for molecule in molecules]
+        if all(v is None for v in nmeigen):
+            nmeigen = None
+        
+        connection = None
+        if any(molecule.connection is not None for molecule in molecules):
+            connection = np.array([molecule.connection or ("", "") for molecule in molecules], dtype=str).reshape(-1, 2)
+        
+        return cls(
+            names=np.array([molecule.name for molecule in molecules], dtype=str),
+            symbols=np.array(symbols, dtype=str) if coords else None,
+            coords=(
+                np.array([molecule.atomcoords for molecule in molecules], dtype=float).reshape(len(molecules), len(symbols), 3)
+                if coords else None
+            ),
+            scfenergy=_column(molecules, "scfenergy"),
+            afirenergy=_column(molecules, "afirenergy"),
+            zpve=_column(molecules, "zpve"),
+            mult=_column(molecules, "mult"),
+            nmeigen=nmeigen,
+            nmeigen_offsets=None,
+            connection=connection,
+        )
+    
+    def concatenate(self, other):
+        """
+        Returns a store with the structures of other after those of this one.
+        Raises ValueError if the two do not share the same symbols.
+        """
+        if not len(other):
+            return self
+        if not len(self):
+            return other
+        if self._symbols != other._symbols:
+            raise ValueError("Molecules with different atoms cannot be stored in columns.")
+        
+        if self._nmeigen is None and other._nmeigen is None:
+            nmeigen = offsets = None
+        elif isinstance(self._nmeigen, np.ndarray):
+            # Keep the decoded buffer and decode the eigenvalues of other onto it.
+            values, other_offsets = other._nmeigen_buffer()
+            nmeigen = np.concatenate([self._nmeigen, values])
+            offsets = np.concatenate([self._nmeigen_offsets, self._nmeigen_offsets[-1] + other_offsets[1:]])
+        else:
+            nmeigen = self._nmeigen_values() + other._nmeigen_values()
+            offsets = None
+        
+        connection = None
+        if self.connection is not None or other.connection is not None:
+            connection = np.concatenate([self._connection_or_empty(), other._connection_or_empty()])
+        
+        return MoleculeStore(
+            names=np.concatenate([self.names, other.names]),
+            symbols=self.symbols,
+            coords=np.concatenate([self.coords, other.coords]),
+            scfenergy=np.concatenate([self.scfenergy, other.scfenergy]),
+            afirenergy=np.concatenate([self.afirenergy, other.afirenergy]),
+            zpve=np.concatenate([self.zpve, other.zpve]),
+            mult=np.concatenate([self.mult, other.mult]),
+            nmeigen=nmeigen,
+            nmeigen_offsets=offsets,
+            connection=connection,
+        )
+    
+    def molecule(self, i):
+        """
+        Returns a Molecule whose arrays are views into the store.
+        """
+        return Molecule(
+            name=str(self.names[i]),
+            mult=_scalar(self.mult[i]),
+            symbols=self._symbols,
+            atomcoords=self.coords[i],
+            scfenergy=_scalar(self.scfenergy[i]),
+            afirenergy=_scalar(self.afirenergy[i]),
+            zpve=_scalar(self.zpve[i]),
+            nmeigen=None if self._nmeigen is None else _Lazy(self._nmeigen_of, i),
+            connection=None if self.connection is None else tuple(self.connection[i].tolist()),
+        )
+    
+    def _nmeigen_of(self, i):
+        return self.nmeigen[self.nmeigen_offsets[i]:self.nmeigen_offsets[i + 1]]
+    
+    def _nmeigen_buffer(self):
+        if self._nmeigen is None:
+            return np.empty(0), np.zeros(len(self) + 1, dtype=np.int64)
+        return self.nmeigen, self.nmeigen_offsets
+    
+    def _nmeigen_values(self):
+        """
+        The eigenvalues as a list per structure, with lazy fields left undecoded.
+        """
+        if self._nmeigen is None:
+            return [None] * len(self)
+        if isinstance(self._nmeigen, list):
+            return self._nmeigen
+        return [self._nmeigen_of(i) for i in range(len(self))]
+    
+    def _connection_or_empty(self):
+        if self.connection is None:
+            return np.full((len(self), 2), "", dtype=str)
+        return self.connection
+    
+    def _decode_nmeigen(self):
+        values = [v() if type(v) is _Lazy else v for v in self._nmeigen]
+        values = [np.empty(0) if v is None else v for v in values]
+        offsets = np.zeros(len(values) + 1, dtype=np.int64)
+        np.cumsum([len(v) for v in values], out=offsets[1:])
+        self._nmeigen = np.concatenate(values) if values else np.empty(0)
+        self._nmeigen_offsets = offsets
+
+
+def _in_store(molecules):
+    """
+    Whether a MoleculeStore keeps every field of the molecules, i.e. none has grads, a Hessian, a status,
+    a charge or a non-default functional, basis set or comments.
+    """
+    return all(
+        molecule._grads is None
+        and molecule._hessian_packed is None
+        and molecule.status is None
+        and molecule.charge == 0
+        and molecule._extra is None
+        for molecule in molecules
+    )
+
+
+def _column(molecules, field):
+    return np.array([np.nan if (v := getattr(molecule, field)) is None else v for molecule in molecules], dtype=float)
+
+
+def _scalar(value):
+    return None if np.isnan(value) else float(value)
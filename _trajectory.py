@@ -0,0 +1,118 @@
+from .data import symbols_to_z
+
+
+_GRAD = " GradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGrad\n"
+
+_ORIENTATION = (
+    _GRAD
+    + "                          Input orientation:                          \n"
+    + " ---------------------------------------------------------------------\n"
+    + " Center     Atomic      Atomic             Coordinates (Angstroms)    \n"
+    + " Number     Number       Type             X           Y           Z   \n"
+    + " ---------------------------------------------------------------------\n"
+)
+
+_GV_FRAME = (
+    _ORIENTATION
+    + " ---------------------------------------------------------------------\n"
+    + " \n"
+    + _GRAD
+    + " Step number   1 out of a maximum of   2 on scan point {i:5d} out of {num:5d}\n"
+    + " \n"
+    + _ORIENTATION
+    + "{atoms}"
+    + " ---------------------------------------------------------------------\n"
+    + " SCF Done:  E({functional}) = {scfenergy:15.12f}     A.U.\n"
+    + " \n"
+    + _GRAD
+    + " Step number   2 out of a maximum of   2 on scan point {i:5d} out of {num:5d}\n"
+    + " \n"
+)
+
+_EXTXYZ_FIELDS = (
+    ("name", "name"),
+    ("scfenergy", "energy"),
+    ("afirenergy", "afir_energy"),
+    ("zpve", "zpve"),
+    ("charge", "charge"),
+    ("mult", "mult"),
+    ("status", "status"),
+)
+
+# Frames are written one by one through a large buffer, so memory does not grow with the trajectory.
+_BUFFER_SIZE = 1 << 20
+
+
+def _write_gv(path, molecules):
+    """
+    Write molecules as a Gaussian scan log that GaussView opens as a trajectory.
+    """
+    num = len(molecules)
+    templates = {}
+    
+    with open(path, "w", buffering=_BUFFER_SIZE) as f:
+        f.write(" #p\n \n")
+        for i, molecule in enumerate(molecules):
+            template = templates.get(molecule.symbols)
+            if template is None:
+                template = templates[molecule.symbols] = _gv_atoms(molecule.symbols)
+            f.write(_GV_FRAME.format(
+                i=i + 1,
+                num=num,
+                atoms=template % tuple(molecule.atomcoords.ravel().tolist()),
+                functional=molecule.functional,
+                scfenergy=molecule.scfenergy,
+            ))
+        f.write(_GRAD + " Normal termination of Gaussian 16\n")
+
+
+def _write_xyz(path, molecules, extended=False):
+    """
+    Write molecules as a multi-frame XYZ file.
+    With extended=True, the comment lines carry the fields in the extended XYZ key=value format.
+    """
+    templates = {}
+    
+    with open(path, "w", buffering=_BUFFER_SIZE) as f:
+        for molecule in molecules:
+            template = templates.get(molecule.symbols)
+            if template is None:
+                template = templates[molecule.symbols] = _xyz_atoms(molecule.symbols)
+            comment = _extxyz_comment(molecule) if extended else _xyz_comment(molecule)
+            f.write(f"{len(molecule.symbols)}\n{comment}\n")
+            f.write(template % tuple(molecule.atomcoords.ravel().tolist()))
+
+
+def _gv_atoms(symbols):
+    """
+    Returns a %-format template of the atom lines, with the atomic numbers looked up once per trajectory.
+    """
+    return "".join(
+        f"{i+1:7d} {z:10d}           0     %11.6f %11.6f %11.6f\n"
+        for i, z in enumerate(symbols_to_z(symbols).tolist())
+    )
+
+
+def _xyz_atoms(symbols):
+    return "".join(f"{sym:2s} %17.12f %17.12f %17.12f\n" for sym in symbols)
+
+
+def _xyz_comment(molecule):
+    return " ".join(
+        str(value) for value in (molecule.name, molecule.scfenergy) if value is not None
+    )
+
+
+def _extxyz_comment(molecule):
+    items = ["Properties=species:S:1:pos:R:3"]
+    for field, key in _EXTXYZ_FIELDS:
+        value = getattr(molecule, field)
+        if value is None:
+            continue
+        if isinstance(value, str):
+            items.append(f'{key}="{value}"' if " " in value else f"{key}={value}")
+        else:
+            items.append(f"{key}={value}")
+    if molecule.connection is not None:
+        items.append(f'connection="{molecule.connection[0]} {molecule.connection[1]}"')
+    return " ".join(items)
@@ -0,0 +1,151 @@
+import itertools
+
+import numpy as np
+from scipy.optimize import linear_sum_assignment
+from scipy.spatial import distance
+
+
+# Number of structure pairs aligned at once in get_rmsd_matrix, which bounds the memory of the stacked SVDs.
+_CHUNK_PAIRS = 1 << 18
+
+# Proper sign flips of the principal axes, used as starting orientations for the permutation search.
+_AXIS_SIGNS = [np.diag(s) for s in itertools.product((1, -1), repeat=3) if np.prod(s) > 0]
+
+
+def align(reference, atomcoords):
+    """
+    Rotate and translate atomcoords, one structure (n, 3) or a stack (F, n, 3), onto reference by the Kabsch algorithm.
+    """
+    reference = np.asarray(reference, dtype=float)
+    atomcoords = np.asarray(atomcoords, dtype=float)
+    P = atomcoords - atomcoords.mean(axis=-2, keepdims=True)
+    Q = reference - reference.mean(axis=-2, keepdims=True)
+    R, _ = _kabsch(P, Q)
+    return P @ R + reference.mean(axis=-2, keepdims=True)
+
+
+def get_rmsd(reference, atomcoords, symbols=None, permute=False):
+    """
+    RMSD after the Kabsch alignment between reference (n, 3) and one structure (n, 3) or a stack (F, n, 3).
+    With permute=True, atoms of the same element in symbols are also matched by the Hungarian algorithm,
+    starting from the given order and the principal axes.
+    """
+    reference = np.asarray(reference, dtype=float)
+    atomcoords = np.asarray(atomcoords, dtype=float)
+    single = atomcoords.ndim == 2
+    stack = atomcoords.reshape(-1, *atomcoords.shape[-2:])
+    
+    P = stack - stack.mean(axis=1, keepdims=True)
+    Q = reference - reference.mean(axis=0)
+    if permute:
+        if symbols is None:
+            raise ValueError("symbols are required to permute the atoms.")
+        groups = _element_groups(symbols)
+        P = np.array([x[_match(Q, x, groups)] for x in P])
+    
+    _, rmsd = _kabsch(P, Q, rotations=False)
+    return float(rmsd[0]) if single else rmsd
+
+
+def get_rmsd_matrix(coords, other=None, symbols=None, permute=False):
+    """
+    (A, B) RMSDs between the stacks coords (A, n, 3) and other (B, n, 3), or between all pairs of coords.
+    Pairs are aligned in chunks, so the memory does not grow with A * B beyond the result.
+    """
+    coords = np.asarray(coords, dtype=float)
+    other = coords if other is None else np.asarray(other, dtype=float)
+    if permute:
+        return np.array([get_rmsd(reference, other, symbols, permute) for reference in coords]).reshape(len(coords), len(other))
+    
+    P = other - other.mean(axis=1, keepdims=True)
+    Q = coords - coords.mean(axis=1, keepdims=True)
+    n_atoms = P.shape[1]
+    sq_p = np.sum(P ** 2, axis=(1, 2))
+    sq_q = np.sum(Q ** 2, axis=(1, 2))
+    # (3B, n) @ (n, 3A) gives the correlation matrices of all pairs in one product.
+    P_t = P.transpose(0, 2, 1).reshape(-1, n_atoms)
+    
+    rmsd = np.empty((len(coords), len(other)))
+    step = max(1, _CHUNK_PAIRS // max(len(other), 1))
+    for start in range(0, len(coords), step):
+        Q_chunk = Q[start:start + step]
+        H = (P_t @ Q_chunk.transpose(1, 0, 2).reshape(n_atoms, -1)).reshape(len(P), 3, len(Q_chunk), 3)
+        H = H.transpose(2, 0, 1, 3)
+        rmsd[start:start + step] = _rmsd(H, sq_q[start:start + step, None] + sq_p[None], n_atoms)
+    return rmsd
+
+
+def _kabsch(P, Q, rotations=True):
+    """
+    Rotations R minimizing |P @ R - Q| for centered stacks broadcast over the leading axes, and the RMSDs.
+    """
+    H = np.einsum("...ni,...nj->...ij", P, Q)
+    e0 = np.sum(P ** 2, axis=(-2, -1)) + np.sum(Q ** 2, axis=(-2, -1))
+    if not rotations:
+        return None, _rmsd(H, e0, P.shape[-2])
+    
+    U, S, Vt = np.linalg.svd(H)
+    d = np.sign(np.linalg.det(U @ Vt))
+    rmsd = np.sqrt(np.clip((e0 - 2 * (S[..., 0] + S[..., 1] + d * S[..., 2])) / P.shape[-2], 0, None))
+    U[..., :, 2] *= d[..., None]
+    return U @ Vt, rmsd
+
+
+def _rmsd(H, e0, n_atoms):
+    """
+    RMSDs from the correlation matrices H alone. The rotation is not needed, so the SVD skips U and Vt
+    and the reflection sign comes from det(H).
+    """
+    S = np.linalg.svd(H, compute_uv=False)
+    d = np.sign(np.linalg.det(H))
+    return np.sqrt(np.clip((e0 - 2 * (S[..., 0] + S[..., 1] + d * S[..., 2])) / n_atoms, 0, None))
+
+
+def _element_groups(symbols):
+    symbols = np.asarray(symbols, dtype=str)
+    return [np.flatnonzero(symbols == symbol) for symbol in np.unique(symbols)]
+
+
+def _match(Q, P, groups, max_iterations=10):
+    """
+    Returns the order of the atoms of P (centered) that best matches Q (centered), element by element.
+    Alternates Hungarian assignment and Kabsch alignment from several starting orientations.
+    """
+    best_order, best_rmsd = None, np.inf
+    for R in _starting_rotations(Q, P):
+        X = P @ R
+        order = None
+        for _ in range(max_iterations):
+            new_order = _assign(Q, X, groups)
+            if order is not None and np.array_equal(new_order, order):
+                break
+            order = new_order
+            R, _ = _kabsch(P[order], Q)
+            X = P @ R
+        _, rmsd = _kabsch(P[order], Q, rotations=False)
+        if rmsd < best_rmsd:
+            best_order, best_rmsd = order, rmsd
+    return best_order
+
+
+def _assign(Q, X, groups):
+    order = np.arange(len(X))
+    for group in groups:
+        _, columns = linear_sum_assignment(distance.cdist(Q[group], X[group], "sqeuclidean"))
+        order[group] = group[columns]
+    return order
+
+
+def _starting_rotations(Q, P):
+    """
+    Identity, and the rotations that put the principal axes of P onto those of Q.
+    """
+    _, Vq = np.linalg.eigh(Q.T @ Q)
+    _, Vp = np.linalg.eigh(P.T @ P)
+    rotations = [np.eye(3)]
+    for signs in _AXIS_SIGNS:
+        R = Vp @ signs @ Vq.T
+        if np.linalg.det(R) < 0:
+            R = Vp @ (signs * np.diag((1, 1, -1))) @ Vq.T
+        rotations.append(R)
+    return rotations
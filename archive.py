@@ -0,0 +1,161 @@
+import json
+import os
+
+import numpy as np
+
+from .eq_list import EQList
+from .lup_ts import LUPTS
+from .min import MIN
+from .pt_list import PTList
+from .reaction_path_network import ReactionPathNetwork
+from ._packing import _pack_molecules, _unpack_molecules
+from ._store import MoleculeStore, _in_store
+
+
+ARCHIVE_VERSION = 1
+
+_STORE_ARRAYS = ("names", "symbols", "coords", "scfenergy", "afirenergy", "zpve", "mult")
+
+
+def save(obj, path):
+    """
+    Save an EQList, PTList, LUPTS, MIN or ReactionPathNetwork to the directory path.
+    Each array is an .npy file next to a meta.json, so that load can memory-map them.
+    path must be empty, missing or an earlier archive, whose arrays are replaced.
+    """
+    _prepare(path)
+    
+    if isinstance(obj, ReactionPathNetwork):
+        meta = {"type": "ReactionPathNetwork"}
+        save(obj.eq_list, os.path.join(path, "eq_list"))
+        save(obj.pt_list, os.path.join(path, "pt_list"))
+    elif isinstance(obj, (EQList, PTList)):
+        meta = {"type": type(obj).__name__, "name": _name(obj.name)}
+        store = obj._store
+        if store is None:
+            molecules = list(obj)
+            if _in_store(molecules):
+                try:
+                    store = MoleculeStore.from_molecules(molecules)
+                except ValueError:
+                    pass
+        if store is None:
+            meta["layout"] = "packed"
+            meta["arrays"] = _save_arrays(path, _pack_molecules(molecules))
+        else:
+            meta["layout"] = "store"
+            arrays = {key: getattr(store, key) for key in _STORE_ARRAYS}
+            if store.nmeigen is not None:
+                arrays["nmeigen"] = store.nmeigen
+                arrays["nmeigen_offsets"] = store.nmeigen_offsets
+            if store.connection is not None:
+                arrays["connection"] = store.connection
+            meta["arrays"] = _save_arrays(path, arrays)
+    elif isinstance(obj, MIN):
+        meta = {"type": "MIN", "name": _name(obj.name)}
+        meta["arrays"] = _save_arrays(path, _pack_molecules(obj.itrs + [obj.optimized]))
+    elif isinstance(obj, LUPTS):
+        meta = {"type": "LUPTS", "name": _name(obj.name)}
+        meta["arrays"] = _save_arrays(path, _pack_molecules(obj.irc))
+    else:
+        raise TypeError(f"Cannot save {type(obj).__name__}.")
+    
+    meta["version"] = ARCHIVE_VERSION
+    with open(os.path.join(path, "meta.json"), "w") as f:
+        json.dump(meta, f)
+
+
+def load(path, mmap=True):
+    """
+    Load an object saved by save. With mmap=True, the arrays are memory-mapped and only the
+    parts that are accessed are read from disk.
+    """
+    with open(os.path.join(path, "meta.json")) as f:
+        meta = json.load(f)
+    
+    if meta["version"] > ARCHIVE_VERSION:
+        raise ValueError(f"Archive version {meta['version']} is newer than this reader ({ARCHIVE_VERSION}).")
+    
+    kind = meta["type"]
+    
+    if kind == "ReactionPathNetwork":
+        return ReactionPathNetwork(
+            load(os.path.join(path, "eq_list"), mmap=mmap),
+            load(os.path.join(path, "pt_list"), mmap=mmap),
+        )
+    
+    arrays = _load_arrays(path, meta["arrays"], mmap)
+    
+    if kind in ("EQList", "PTList"):
+        cls = EQList if kind == "EQList" else PTList
+        if meta["layout"] == "packed":
+            return cls(name=meta["name"], molecules=_unpack_molecules(arrays))
+        store = MoleculeStore(
+            nmeigen=arrays.pop("nmeigen", None),
+            nmeigen_offsets=arrays.pop("nmeigen_offsets", None),
+            connection=arrays.pop("connection", None),
+            **arrays,
+        )
+        return cls(name=meta["name"], store=store)
+    elif kind == "MIN":
+        molecules = _unpack_molecules(arrays)
+        return MIN(name=meta["name"], itrs=molecules[:-1], optimized=molecules[-1])
+    elif kind == "LUPTS":
+        return LUPTS(name=meta["name"], irc=_unpack_molecules(arrays))
+    else:
+        raise ValueError(f"Unknown archive type {kind}.")
+
+
+def _load_as(cls, path, mmap):
+    obj = load(path, mmap=mmap)
+    if not isinstance(obj, cls):
+        raise TypeError(f"{path} contains a {type(obj).__name__}, not a {cls.__name__}.")
+    return obj
+
+
+def _prepare(path):
+    """
+    Create the directory path, or remove the arrays listed in the meta.json of an archive already there.
+    Raises FileExistsError if path is a non-empty directory that is not an archive.
+    """
+    os.makedirs(path, exist_ok=True)
+    meta_path = os.path.join(path, "meta.json")
+    
+    if not os.path.exists(meta_path):
+        if os.listdir(path):
+            raise FileExistsError(f"{path} is not empty and is not an archive.")
+        return
+    
+    with open(meta_path) as f:
+        meta = json.load(f)
+    for key in meta.get("arrays", ()):
+        file_path = os.path.join(path, f"{key}.npy")
+        if os.path.exists(file_path):
+            os.remove(file_path)
+
+
+def _save_arrays(path, arrays):
+    """
+    Save each array as <key>.npy and return the keys, which are listed in meta.json.
+    """
+    for key, array in arrays.items():
+        np.save(os.path.join(path, f"{key}.npy"), np.asarray(array))
+    return sorted(arrays)
+
+
+def _load_arrays(path, keys, mmap):
+    arrays = {}
+    
+    for key in keys:
+        file_path = os.path.join(path, f"{key}.npy")
+        try:
+            array = np.load(file_path, mmap_mode="r" if mmap else None)
+        except ValueError:  # empty arrays cannot be memory-mapped
+            array = np.load(file_path)
+        arrays[key] = array
+    
+    return arrays
+
+
+def _name(name):
+    return None if name is None else os.fspath(name)
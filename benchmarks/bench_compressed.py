@@ -0,0 +1,92 @@
+"""
+Throughput of the readers on plain and compressed files.
+
+Run from the directory containing the package:
+    python -m grrmlib.benchmarks.bench_compressed
+"""
+import bz2
+import gzip
+import lzma
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from grrmlib import read_eq_list, read_min
+from grrmlib.benchmarks.bench_optopt import write_min_log
+from grrmlib._open import _zstd
+
+
+N_ATOMS = 30
+N_EQS = 2000
+N_ITRS = 2000
+
+
+def write_eq_list(path, n_eq, seed=0):
+    rng = np.random.default_rng(seed)
+    lines = ["List of Equilibrium Structures\n", "\n"]
+    
+    for k in range(n_eq):
+        coords = [f"C        {x:15.12f}   {y:15.12f}   {z:15.12f}\n" for x, y, z in rng.normal(0, 2, (N_ATOMS, 3))]
+        eigen = rng.normal(0, 0.1, 3 * N_ATOMS - 6)
+        eigen = ["  " + "  ".join(f"{v:13.9f}" for v in eigen[i:i + 6]) + "\n" for i in range(0, len(eigen), 6)]
+        lines += [f"# Geometry of EQ {k}, SYMMETRY = C1  \n", *coords]
+        lines += ["Energy    = -154.123456789012 (-154.122456789012 :  -0.001000000000)\n"]
+        lines += ["Spin(**2) =    0.000000000000\n", "ZPVE      =    0.081234567891\n"]
+        lines += ["Normal mode eigenvalues : nmode = 84\n", *eigen, "\n"]
+    
+    with open(path, "w") as f:
+        f.writelines(lines)
+
+
+def compress(path):
+    with open(path, "rb") as f:
+        data = f.read()
+    
+    paths = {"plain": path}
+    for suffix, module in ((".gz", gzip), (".xz", lzma), (".bz2", bz2)):
+        with module.open(path + suffix, "wb") as f:
+            f.write(data)
+        paths[suffix] = path + suffix
+    
+    zstd = _zstd()
+    if zstd is not None:
+        with zstd.open(path + ".zst", "wb") as f:
+            f.write(data)
+        paths[".zst"] = path + ".zst"
+    
+    return paths
+
+
+def main(repeat=3):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        eq_path = os.path.join(tmpdir, "job_EQ_list.log")
+        min_path = os.path.join(tmpdir, "job_MIN.log")
+        write_eq_list(eq_path, N_EQS)
+        write_min_log(min_path, N_ITRS)
+        
+        print(f"{'file':>14s} {'format':>6s} {'size / MB':>10s} {'time / s':>10s} {'MB/s':>8s} {'vs plain':>9s}")
+        
+        for read, path in ((read_eq_list, eq_path), (read_min, min_path)):
+            text_size = os.path.getsize(path) / 1e6
+            plain = None
+            
+            for label, compressed_path in compress(path).items():
+                times = []
+                for _ in range(repeat):
+                    t0 = time.perf_counter()
+                    read(compressed_path, cache=False)
+                    times.append(time.perf_counter() - t0)
+                
+                t = min(times)
+                plain = plain or t
+                size = os.path.getsize(compressed_path) / 1e6
+                print(
+                    f"{os.path.basename(path):>14s} {label:>6s} {size:10.2f} {t:10.3f} "
+                    f"{text_size / t:8.1f} {t / plain:9.2f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Benchmark of the array-backed ReactionGraph against the networkx rpn graph: time and peak memory
+of building the graph and finding its connected components, up to 10^5 EQs.
+
+Run from the directory containing the package:
+    python -m grrmlib.benchmarks.bench_graph
+"""
+import time
+import tracemalloc
+
+import networkx as nx
+
+from grrmlib.benchmarks.bench_paths import make_network
+
+
+SIZES = ((1000, 3000), (10000, 30000), (100000, 300000))
+
+
+def measure(function):
+    tracemalloc.start()
+    start = time.perf_counter()
+    function()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak / 2 ** 20
+
+
+def main():
+    print(f"{'EQs':>8s} {'TSs':>8s} {'graph / s':>10s} {'graph / MiB':>12s} {'rpn / s':>8s} {'rpn / MiB':>10s}")
+    for n_eqs, n_tss in SIZES:
+        network = make_network(n_eqs, n_tss)
+        network.eq_list.store
+        network.pt_list.store
+    
+        def graph():
+            network._graph = None
+            network.graph.components()
+    
+        def rpn():
+            network._rpn = None
+            list(nx.connected_components(network.rpn))
+    
+        graph_time, graph_memory = measure(graph)
+        rpn_time, rpn_memory = measure(rpn)
+        print(f"{n_eqs:8d} {n_tss:8d} {graph_time:10.3f} {graph_memory:12.1f} {rpn_time:8.3f} {rpn_memory:10.1f}")
+
+
+if __name__ == "__main__":
+    main()
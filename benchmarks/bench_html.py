@@ -0,0 +1,45 @@
+"""
+Benchmark of ReactionPathNetwork.to_html_stream, plain and compact, against to_html on synthetic networks
+with three TSs per EQ. to_html is only run on the smaller networks.
+
+Run from the directory containing the package:
+    python -m grrmlib.benchmarks.bench_html
+"""
+import os
+import tempfile
+import time
+
+from grrmlib.benchmarks.bench_paths import make_network
+
+
+SIZES = (1000, 5000, 50000)
+MAX_TO_HTML = 5000
+
+
+def measure(function, path):
+    start = time.perf_counter()
+    function(path)
+    return time.perf_counter() - start, os.path.getsize(path) / 2 ** 20
+
+
+def main():
+    print(f"{'EQs':>8s} {'method':>22s} {'time / s':>9s} {'size / MiB':>11s}")
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "network.html")
+        for n_eqs in SIZES:
+            network = make_network(n_eqs, 3 * n_eqs)
+            network.eq_list.store
+            network.pt_list.store
+            methods = [
+                ("to_html_stream", lambda path: network.to_html_stream(path)),
+                ("to_html_stream compact", lambda path: network.to_html_stream(path, compact=True)),
+            ]
+            if n_eqs <= MAX_TO_HTML:
+                methods.append(("to_html", lambda path: network.to_html(path)))
+            for name, function in methods:
+                elapsed, size = measure(function, path)
+                print(f"{n_eqs:8d} {name:>22s} {elapsed:9.3f} {size:11.2f}")
+
+
+if __name__ == "__main__":
+    main()
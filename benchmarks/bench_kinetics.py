@@ -0,0 +1,73 @@
+"""
+Benchmark of the master-equation kinetics on synthetic networks with mostly local connections,
+up to 10^5 TSs. Populations are integrated over 12 decades of time (1 ns to 1000 s).
+
+Run from the directory containing the package:
+    python -m grrmlib.benchmarks.bench_kinetics
+"""
+import time
+
+import numpy as np
+
+from grrmlib import EQList, PTList, ReactionPathNetwork
+from grrmlib._store import MoleculeStore
+
+
+SIZES = ((300, 1000), (3000, 10000), (30000, 100000))
+TIMES = np.logspace(-9, 3, 13)
+
+
+def _store(names, energies, connection=None):
+    n = len(names)
+    return MoleculeStore(
+        names=names,
+        symbols=np.array(["H"]),
+        coords=np.zeros((n, 1, 3)),
+        scfenergy=energies,
+        afirenergy=np.full(n, np.nan),
+        zpve=np.zeros(n),
+        mult=np.full(n, np.nan),
+        nmeigen=None,
+        nmeigen_offsets=None,
+        connection=connection,
+    )
+
+
+def make_network(n_eqs, n_tss, seed=0):
+    rng = np.random.default_rng(seed)
+    eq_names = np.array([f"EQ{i}" for i in range(n_eqs)])
+    eq_energies = rng.normal(0, 0.01, n_eqs)
+    
+    a = rng.integers(0, n_eqs, n_tss)
+    b = (a + rng.geometric(0.3, n_tss)) % n_eqs
+    ts_energies = np.maximum(eq_energies[a], eq_energies[b]) + rng.uniform(0.02, 0.06, n_tss)
+    connection = np.stack([eq_names[a], eq_names[b]], axis=1)
+    
+    return ReactionPathNetwork(
+        EQList(store=_store(eq_names, eq_energies)),
+        PTList(store=_store(np.array([f"TS{i}" for i in range(n_tss)]), ts_energies, connection)),
+    )
+
+
+def main():
+    print(f"{'EQs':>8s} {'TSs':>8s} {'build / s':>10s} {'bdf / s':>10s} {'steady / s':>11s}")
+    for n_eqs, n_tss in SIZES:
+        network = make_network(n_eqs, n_tss)
+    
+        start = time.perf_counter()
+        kinetics = network.kinetics(temperature=500.0)
+        build = time.perf_counter() - start
+    
+        start = time.perf_counter()
+        kinetics.populations(TIMES, "EQ0")
+        bdf = time.perf_counter() - start
+    
+        start = time.perf_counter()
+        kinetics.steady_state("EQ0")
+        steady = time.perf_counter() - start
+    
+        print(f"{n_eqs:8d} {n_tss:8d} {build:10.3f} {bdf:10.3f} {steady:11.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Benchmark of the OPTOPT reader against the number of ITR blocks.
+The time per ITR should stay flat, i.e. the total time scales linearly.
+
+Run from the directory containing the package:
+    python -m grrmlib.benchmarks.bench_optopt
+"""
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from grrmlib import read_min
+
+
+N_ATOMS = 30
+N_ITRS = (250, 500, 1000, 2000, 4000, 8000)
+
+
+def _coord_lines(rng):
+    return [
+        f"C        {x:15.12f}   {y:15.12f}   {z:15.12f}\n"
+        for x, y, z in rng.normal(0, 2, (N_ATOMS, 3))
+    ]
+
+
+def _eigen_lines(rng):
+    vals = rng.normal(0, 0.1, 3 * N_ATOMS - 6)
+    return ["  " + "  ".join(f"{v:13.9f}" for v in vals[i:i + 6]) + "\n" for i in range(0, len(vals), 6)]
+
+
+def write_min_log(path, n_itr, seed=0):
+    rng = np.random.default_rng(seed)
+    lines = ["OPTOPT-OPTOPT-OPTOPT-OPTOPT-OPTOPT-OPTOPT\n"]
+    
+    for k in range(n_itr):
+        lines += [f"# ITR. {k}\n", *_coord_lines(rng), "Item                  Value     Threshold\n"]
+        lines += ["ENERGY         -154.123456789012 (-154.113456789012 : -0.0100000)\n"]
+        lines += ["Spin(**2)      0.000000000000\n", "NORMAL MODE EIGENVALUES : nmode = 84\n", *_eigen_lines(rng)]
+    
+    lines += ["\n", "Number of ITR exceeded\n", "OPTOPT-OPTOPT-OPTOPT-OPTOPT-OPTOPT-OPTOPT\n"]
+    
+    with open(path, "w") as f:
+        f.writelines(lines)
+
+
+def main(repeat=3):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        print(f"{'ITRs':>8s} {'time / s':>10s} {'us / ITR':>10s}")
+        
+        for n_itr in N_ITRS:
+            path = os.path.join(tmpdir, f"MIN_{n_itr}.log")
+            write_min_log(path, n_itr)
+            
+            times = []
+            for _ in range(repeat):
+                t0 = time.perf_counter()
+                read_min(path)
+                times.append(time.perf_counter() - t0)
+            
+            t = min(times)
+            print(f"{n_itr:8d} {t:10.4f} {t / n_itr * 1e6:10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Benchmark of the path queries on synthetic networks with random connections, up to 10^5 TSs,
+against the minimum spanning tree of networkx on the rpn graph.
+
+Run from the directory containing the package:
+    python -m grrmlib.benchmarks.bench_paths
+"""
+import time
+
+import networkx as nx
+import numpy as np
+
+from grrmlib import EQList, PTList, ReactionPathNetwork
+from grrmlib.benchmarks.bench_kinetics import _store
+
+
+SIZES = ((300, 1000), (3000, 10000), (30000, 100000))
+N_QUERIES = 1000
+
+
+def make_network(n_eqs, n_tss, seed=0):
+    rng = np.random.default_rng(seed)
+    eq_names = np.array([f"EQ{i}" for i in range(n_eqs)])
+    eq_energies = rng.normal(0, 0.01, n_eqs)
+    
+    a = rng.integers(0, n_eqs, n_tss)
+    b = rng.integers(0, n_eqs, n_tss)
+    ts_energies = np.maximum(eq_energies[a], eq_energies[b]) + rng.uniform(0.02, 0.06, n_tss)
+    connection = np.stack([eq_names[a], eq_names[b]], axis=1)
+    
+    return ReactionPathNetwork(
+        EQList(store=_store(eq_names, eq_energies)),
+        PTList(store=_store(np.array([f"TS{i}" for i in range(n_tss)]), ts_energies, connection)),
+    )
+
+
+def main():
+    print(f"{'EQs':>8s} {'TSs':>8s} {'build / s':>10s} {'barrier / us':>13s} {'k=5 / s':>8s} {'networkx / s':>13s}")
+    for n_eqs, n_tss in SIZES:
+        network = make_network(n_eqs, n_tss)
+    
+        start = time.perf_counter()
+        paths = network.paths()
+        build = time.perf_counter() - start
+    
+        connected = np.flatnonzero(paths.component == paths.component[0])
+        pairs = np.random.default_rng(1).choice(connected, (N_QUERIES, 2))
+        start = time.perf_counter()
+        for a, b in pairs.tolist():
+            paths.barrier(paths.eq_names[a], paths.eq_names[b])
+        barrier = (time.perf_counter() - start) / N_QUERIES * 1e6
+    
+        start = time.perf_counter()
+        paths.k_best_paths(paths.eq_names[pairs[0, 0]], paths.eq_names[pairs[0, 1]], k=5)
+        k_best = time.perf_counter() - start
+    
+        start = time.perf_counter()
+        nx.minimum_spanning_tree(nx.Graph(network.rpn))
+        networkx = time.perf_counter() - start
+    
+        print(f"{n_eqs:8d} {n_tss:8d} {build:10.3f} {barrier:13.1f} {k_best:8.3f} {networkx:13.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+import hashlib
+import os
+import tempfile
+import zipfile
+
+import numpy as np
+
+from ._packing import _pack_molecules, _unpack_molecules
+
+
+# Bump when a change of the parsers alters their results, so stale cache entries are not reused.
+PARSER_VERSION = 1
+
+_cache = None
+
+
+class ParseCache:
+    """
+    On-disk cache of parsed results, stored as .npz files of packed arrays.
+    Entries are keyed by the absolute path, size and mtime of the source file, the reader and PARSER_VERSION.
+    The least recently used entries are evicted when the total size exceeds max_bytes.
+    """
+    
+    def __init__(self, directory=None, max_bytes=1 << 30):
+        if directory is None:
+            directory = os.environ.get("GRRMLIB_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "grrmlib"))
+        self.directory = directory
+        self.max_bytes = max_bytes
+    
+    def get(self, kind, path):
+        entry = self._entry(kind, path)
+        
+        try:
+            with np.load(entry) as npz:
+                packed = {key: npz[key] for key in npz.files}
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, EOFError, KeyError, zipfile.BadZipFile):
+            # A truncated or corrupt entry is removed, so that the next read parses the file and stores it again.
+            _remove(entry)
+            return None
+        
+        # Mark the entry as recently used. It stays valid if this fails, e.g. on a read-only cache.
+        try:
+            os.utime(entry)
+        except OSError:
+            pass
+        
+        return packed
+    
+    def put(self, kind, path, packed):
+        """
+        Store packed as the entry of path. Nothing is stored if the cache directory cannot be written,
+        e.g. when it is read-only or the disk is full, so the readers still return what they parsed.
+        """
+        entry = self._entry(kind, path)
+        
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            for stale in self._entries(f"{_path_hash(path)}-{kind}-"):
+                _remove(stale)
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        except OSError:
+            return
+        
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(f, **packed)
+            os.replace(tmp, entry)
+        except OSError:
+            _remove(tmp)
+            return
+        except BaseException:
+            _remove(tmp)
+            raise
+        
+        self.evict()
+    
+    def invalidate(self, path=None):
+        """
+        Remove the entries of path, or all entries if path is None.
+        """
+        for entry in self._entries("" if path is None else f"{_path_hash(path)}-"):
+            _remove(entry)
+    
+    def evict(self):
+        entries = []
+        
+        for entry in self._entries(""):
+            try:
+                stat = os.stat(entry)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, entry))
+        
+        total = sum(size for _, size, _ in entries)
+        
+        for _, size, entry in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            _remove(entry)
+            total -= size
+    
+    def _entry(self, kind, path):
+        stat = os.stat(path)
+        key = hashlib.sha1(f"{stat.st_size}\0{stat.st_mtime_ns}\0{PARSER_VERSION}".encode()).hexdigest()[:16]
+        return os.path.join(self.directory, f"{_path_hash(path)}-{kind}-{key}.npz")
+    
+    def _entries(self, prefix):
+        try:
+            file_names = os.listdir(self.directory)
+        except OSError:
+            return []
+        return [
+            os.path.join(self.directory, file_name) for file_name in file_names
+            if file_name.startswith(prefix) and file_name.endswith(".npz")
+        ]
+
+
+def enable_cache(directory=None, max_bytes=1 << 30):
+    """
+    Use a ParseCache in all readers unless they are called with cache=False.
+    """
+    global _cache
+    _cache = ParseCache(directory=directory, max_bytes=max_bytes)
+    return _cache
+
+
+def disable_cache():
+    global _cache
+    _cache = None
+
+
+def get_cache():
+    return _cache
+
+
+def _resolve(cache):
+    """
+    cache=None means the cache set by enable_cache (if any), False means no cache.
+    """
+    if cache is None:
+        return _cache
+    return cache or None
+
+
+def _cached_molecules(kind, path, cache, read, fields=None):
+    """
+    Returns the list of molecules read by read() from the cache if possible.
+    """
+    cache = _resolve(cache)
+    
+    if cache is None:
+        return read()
+    
+    if fields is not None:
+        kind = f"{kind}_{'+'.join(sorted(fields))}"
+    
+    packed = cache.get(kind, path)
+    if packed is not None:
+        return _unpack_molecules(packed)
+    
+    molecules = read()
+    cache.put(kind, path, _pack_molecules(molecules))
+    return molecules
+
+
+def _path_hash(path):
+    return hashlib.sha1(os.path.abspath(path).encode()).hexdigest()[:16]
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
@@ -1,486 +1,169 @@
+import numpy as np
+
+
+# Element table indexed by atomic number. Index 0 is the non-atom slot, used for the translation vector "TV".
+# Covalent radii: Chem. Eur. J. 2009, 15, 186-197. Masses: standard atomic weights in amu,
+# or the mass number of the longest-lived isotope for elements without a stable one.
+_ELEMENTS = (
+    # symbol, covalent radius, mass
+    ("TV", 1.50, 0.0),
+    ("H", 0.384, 1.008),  #0.32 * 1.2
+    ("He", 0.46 * 1.2, 4.002602),
+    ("Li", 1.33 * 0.8, 6.94),  #1.064
+    ("Be", 1.02 * 0.9, 9.0121831),  #0.918
+    ("B", 0.85, 10.81),
+    ("C", 0.75, 12.011),
+    ("N", 0.71, 14.007),
+    ("O", 0.63, 15.999),
+    ("F", 0.64, 18.998403163),
+    ("Ne", 0.67, 20.1797),
+    ("Na", 1.55 * 0.8, 22.98976928),  #1.240
+    ("Mg", 1.39 * 0.9, 24.305),  #1.251
+    ("Al", 1.26, 26.9815385),
+    ("Si", 1.16, 28.085),
+    ("P", 1.11, 30.973761998),
+    ("S", 1.03, 32.06),
+    ("Cl", 0.99, 35.45),
+    ("Ar", 0.96, 39.948),
+    ("K", 1.96 * 0.8, 39.0983),  #1.568
+    ("Ca", 1.71 * 0.9, 40.078),  #1.539
+    ("Sc", 1.48, 44.955908),
+    ("Ti", 1.36, 47.867),
+    ("V", 1.34, 50.9415),
+    ("Cr", 1.22, 51.9961),
+    ("Mn", 1.19, 54.938044),
+    ("Fe", 1.16, 55.845),
+    ("Co", 1.11, 58.933194),
+    ("Ni", 1.10, 58.6934),
+    ("Cu", 1.12, 63.546),
+    ("Zn", 1.18, 65.38),
+    ("Ga", 1.24, 69.723),
+    ("Ge", 1.21, 72.630),
+    ("As", 1.21, 74.921595),
+    ("Se", 1.16, 78.971),
+    ("Br", 1.14, 79.904),
+    ("Kr", 1.17, 83.798),
+    ("Rb", 2.10 * 0.8, 85.4678),  #1.680
+    ("Sr", 1.85 * 0.9, 87.62),  #1.665
+    ("Y", 1.63, 88.90584),
+    ("Zr", 1.54, 91.224),
+    ("Nb", 1.47, 92.90637),
+    ("Mo", 1.38, 95.95),
+    ("Tc", 1.28, 98.0),
+    ("Ru", 1.25, 101.07),
+    ("Rh", 1.25, 102.90550),
+    ("Pd", 1.20, 106.42),
+    ("Ag", 1.28, 107.8682),
+    ("Cd", 1.36, 112.414),
+    ("In", 1.42, 114.818),
+    ("Sn", 1.40, 118.710),
+    ("Sb", 1.40, 121.760),
+    ("Te", 1.36, 127.60),
+    ("I", 1.33, 126.90447),
+    ("Xe", 1.31, 131.293),
+    ("Cs", 2.32 * 0.8, 132.90545196),  #1.856
+    ("Ba", 1.96 * 0.9, 137.327),  #1.764
+    ("La", 1.80, 138.90547),
+    ("Ce", 1.63, 140.116),
+    ("Pr", 1.76, 140.90766),
+    ("Nd", 1.74, 144.242),
+    ("Pm", 1.73, 145.0),
+    ("Sm", 1.72, 150.36),
+    ("Eu", 1.68, 151.964),
+    ("Gd", 1.69, 157.25),
+    ("Tb", 1.68, 158.92535),
+    ("Dy", 1.67, 162.500),
+    ("Ho", 1.66, 164.93033),
+    ("Er", 1.65, 167.259),
+    ("Tm", 1.64, 168.93422),
+    ("Yb", 1.70, 173.045),
+    ("Lu", 1.62, 174.9668),
+    ("Hf", 1.52, 178.49),
+    ("Ta", 1.46, 180.94788),
+    ("W", 1.37, 183.84),
+    ("Re", 1.31, 186.207),
+    ("Os", 1.29, 190.23),
+    ("Ir", 1.22, 192.217),
+    ("Pt", 1.23, 195.084),
+    ("Au", 1.24, 196.966569),
+    ("Hg", 1.33, 200.592),
+    ("Tl", 1.44, 204.38),
+    ("Pb", 1.44, 207.2),
+    ("Bi", 1.51, 208.98040),
+    ("Po", 1.45, 209.0),
+    ("At", 1.47, 210.0),
+    ("Rn", 1.42, 222.0),
+    ("Fr", 2.23 * 0.8, 223.0),  #1.784
+    ("Ra", 2.01 * 0.9, 226.0),  #1.809
+    ("Ac", 1.86, 227.0),
+    ("Th", 1.75, 232.0377),
+    ("Pa", 1.69, 231.03588),
+    ("U", 1.70, 238.02891),
+    ("Np", 1.71, 237.0),
+    ("Pu", 1.72, 244.0),
+    ("Am", 1.66, 243.0),
+    ("Cm", 1.66, 247.0),
+    ("Bk", 1.68, 247.0),
+    ("Cf", 1.68, 251.0),
+    ("Es", 1.65, 252.0),
+    ("Fm", 1.67, 257.0),
+    ("Md", 1.73, 258.0),
+    ("No", 1.76, 259.0),
+    ("Lr", 1.61, 262.0),
+    ("Rf", 1.57, 267.0),
+    ("Db", 1.49, 268.0),
+    ("Sg", 1.43, 269.0),
+    ("Bh", 1.41, 270.0),
+    ("Hs", 1.34, 269.0),
+    ("Mt", 1.29, 278.0),
+    ("Ds", 1.28, 281.0),
+    ("Rg", 1.21, 282.0),
+    ("Cn", 1.22, 285.0),
+    ("Nh", 1.36, 286.0),
+    ("Fl", 1.43, 289.0),
+    ("Mc", 1.62, 290.0),
+    ("Lv", 1.75, 293.0),
+    ("Ts", 1.65, 294.0),
+    ("Og", 1.57, 294.0),
+)
+
+SYMBOLS = tuple(element[0] for element in _ELEMENTS)
+
+ATOMIC_NUMBERS = {symbol: z for z, symbol in enumerate(SYMBOLS)}
+
+COVALENT_RADII = np.array([element[1] for element in _ELEMENTS])
+
+MASSES = np.array([element[2] for element in _ELEMENTS])
+
+COVALENT_RADII.flags.writeable = False
+MASSES.flags.writeable = False
+
+
+def symbols_to_z(symbols):
+    """
+    Returns the atomic numbers of symbols as an int array. "TV" maps to 0.
+    """
+    try:
+        return np.fromiter((ATOMIC_NUMBERS[s] for s in symbols), dtype=np.intp, count=len(symbols))
+    except KeyError as e:
+        raise ValueError(f"Unknown element symbol: {e.args[0]}") from None
+
+
+def radii(z):
+    return COVALENT_RADII[z]
+
+
+def masses(z):
+    return MASSES[z]
+
+
 def covalent_radius(atom):
     """
     Chem. Eur. J. 2009, 15, 186-197.
     """
-    if atom == 'H':
-        return 0.384  #0.32 * 1.2
-    elif atom == 'C':
-        return 0.75
-    elif atom == 'N':
-        return 0.71
-    elif atom == 'O':
-        return 0.63
-    elif atom == 'He':
-        return 0.46 * 1.2
-    elif atom == 'Li':
-        return 1.33 * 0.8  #1.064
-    elif atom == 'Be':
-        return 1.02 * 0.9  #0.918
-    elif atom == 'B':
-        return 0.85
-    elif atom == 'F':
-        return 0.64
-    elif atom == 'Ne':
-        return 0.67
-    elif atom == 'Na':
-        return 1.55 * 0.8  #1.240
-    elif atom == 'Mg':
-        return 1.39 * 0.9  #1.251
-    elif atom == 'Al':
-        return 1.26
-    elif atom == 'Si':
-        return 1.16
-    elif atom == 'P':
-        return 1.11
-    elif atom == 'S':
-        return 1.03
-    elif atom == 'Cl':
-        return 0.99
-    elif atom == 'Ar':
-        return 0.96
-    elif atom == 'K':
-        return 1.96 * 0.8  #1.568
-    elif atom == 'Ca':
-        return 1.71 * 0.9  #1.539
-    elif atom == 'Sc':
-        return 1.48
-    elif atom == 'Ti':
-        return 1.36
-    elif atom == 'V':
-        return 1.34
-    elif atom == 'Cr':
-        return 1.22
-    elif atom == 'Mn':
-        return 1.19
-    elif atom == 'Fe':
-        return 1.16
-    elif atom == 'Co':
-        return 1.11
-    elif atom == 'Ni':
-        return 1.10
-    elif atom == 'Cu':
-        return 1.12
-    elif atom == 'Zn':
-        return 1.18
-    elif atom == 'Ga':
-        return 1.24
-    elif atom == 'Ge':
-        return 1.21
-    elif atom == 'As':
-        return 1.21
-    elif atom == 'Se':
-        return 1.16
-    elif atom == 'Br':
-        return 1.14
-    elif atom == 'Kr':
-        return 1.17
-    elif atom == 'Rb':
-        return 2.10 * 0.8  #1.680
-    elif atom == 'Sr':
-        return 1.85 * 0.9  #1.665
-    elif atom == 'Y':
-        return 1.63
-    elif atom == 'Zr':
-        return 1.54
-    elif atom == 'Nb':
-        return 1.47
-    elif atom == 'Mo':
-        return 1.38
-    elif atom == 'Tc':
-        return 1.28
-    elif atom == 'Ru':
-        return 1.25
-    elif atom == 'Rh':
-        return 1.25
-    elif atom == 'Pd':
-        return 1.20
-    elif atom == 'Ag':
-        return 1.28
-    elif atom == 'Cd':
-        return 1.36
-    elif atom == 'In':
-        return 1.42
-    elif atom == 'Sn':
-        return 1.40
-    elif atom == 'Sb':
-        return 1.40
-    elif atom == 'Te':
-        return 1.36
-    elif atom == 'I':
-        return 1.33
-    elif atom == 'Xe':
-        return 1.31
-    elif atom == 'Cs':
-        return 2.32 * 0.8  #1.856
-    elif atom == 'Ba':
-        return 1.96 * 0.9  #1.764
-    elif atom == 'La':
-        return 1.80
-    elif atom == 'Ce':
-        return 1.63
-    elif atom == 'Pr':
-        return 1.76
-    elif atom == 'Nd':
-        return 1.74
-    elif atom == 'Pm':
-        return 1.73
-    elif atom == 'Sm':
-        return 1.72
-    elif atom == 'Eu':
-        return 1.68
-    elif atom == 'Gd':
-        return 1.69
-    elif atom == 'Tb':
-        return 1.68
-    elif atom == 'Dy':
-        return 1.67
-    elif atom == 'Ho':
-        return 1.66
-    elif atom == 'Er':
-        return 1.65
-    elif atom == 'Tm':
-        return 1.64
-    elif atom == 'Yb':
-        return 1.70
-    elif atom == 'Lu':
-        return 1.62
-    elif atom == 'Hf':
-        return 1.52
-    elif atom == 'Ta':
-        return 1.46
-    elif atom == 'W':
-        return 1.37
-    elif atom == 'Re':
-        return 1.31
-    elif atom == 'Os':
-        return 1.29
-    elif atom == 'Ir':
-        return 1.22
-    elif atom == 'Pt':
-        return 1.23
-    elif atom == 'Au':
-        return 1.24
-    elif atom == 'Hg':
-        return 1.33
-    elif atom == 'Tl':
-        return 1.44
-    elif atom == 'Pb':
-        return 1.44
-    elif atom == 'Bi':
-        return 1.51
-    elif atom == 'Po':
-        return 1.45
-    elif atom == 'At':
-        return 1.47
-    elif atom == 'Rn':
-        return 1.42
-    elif atom == 'Fr':
-        return 2.23 * 0.8  #1.784
-    elif atom == 'Ra':
-        return 2.01 * 0.9  #1.809
-    elif atom == 'Ac':
-        return 1.86
-    elif atom == 'Th':
-        return 1.75
-    elif atom == 'Pa':
-        return 1.69
-    elif atom == 'U':
-        return 1.70
-    elif atom == 'Np':
-        return 1.71
-    elif atom == 'Pu':
-        return 1.72
-    elif atom == 'Am':
-        return 1.66
-    elif atom == 'Cm':
-        return 1.66
-    elif atom == 'Bk':
-        return 1.68
-    elif atom == 'Cf':
-        return 1.68
-    elif atom == 'Es':
-        return 1.65
-    elif atom == 'Fm':
-        return 1.67
-    elif atom == 'Md':
-        return 1.73
-    elif atom == 'No':
-        return 1.76
-    elif atom == 'Lr':
-        return 1.61
-    elif atom == 'Rf':
-        return 1.57
-    elif atom == 'Db':
-        return 1.49
-    elif atom == 'Sg':
-        return 1.43
-    elif atom == 'Bh':
-        return 1.41
-    elif atom == 'Hs':
-        return 1.34
-    elif atom == 'Mt':
-        return 1.29
-    elif atom == 'Ds':
-        return 1.28
-    elif atom == 'Rg':
-        return 1.21
-    elif atom == 'Cn':
-        return 1.22
-    elif atom == 'Nh':
-        return 1.36
-    elif atom == 'Fl':
-        return 1.43
-    elif atom == 'Mc':
-        return 1.62
-    elif atom == 'Lv':
-        return 1.75
-    elif atom == 'Ts':
-        return 1.65
-    elif atom == 'Og':
-        return 1.57
-    elif atom == 'TV':
-        return 1.50
-    else:
-        return None
+    z = ATOMIC_NUMBERS.get(atom)
+    return None if z is None else float(COVALENT_RADII[z])
 
 
 def atomic_number(atom):
-    if atom == 'H':
-        return 1
-    elif atom == 'C':
-        return 6
-    elif atom == 'N':
-        return 7
-    elif atom == 'O':
-        return 8
-    elif atom == 'He':
-        return 2
-    elif atom == 'Li':
-        return 3
-    elif atom == 'Be':
-        return 4
-    elif atom == 'B':
-        return 5
-    elif atom == 'F':
-        return 9
-    elif atom == 'Ne':
-        return 10
-    elif atom == 'Na':
-        return 11
-    elif atom == 'Mg':
-        return 12
-    elif atom == 'Al':
-        return 13
-    elif atom == 'Si':
-        return 14
-    elif atom == 'P':
-        return 15
-    elif atom == 'S':
-        return 16
-    elif atom == 'Cl':
-        return 17
-    elif atom == 'Ar':
-        return 18
-    elif atom == 'K':
-        return 19
-    elif atom == 'Ca':
-        return 20
-    elif atom == 'Sc':
-        return 21
-    elif atom == 'Ti':
-        return 22
-    elif atom == 'V':
-        return 23
-    elif atom == 'Cr':
-        return 24
-    elif atom == 'Mn':
-        return 25
-    elif atom == 'Fe':
-        return 26
-    elif atom == 'Co':
-        return 27
-    elif atom == 'Ni':
-        return 28
-    elif atom == 'Cu':
-        return 29
-    elif atom == 'Zn':
-        return 30
-    elif atom == 'Ga':
-        return 31
-    elif atom == 'Ge':
-        return 32
-    elif atom == 'As':
-        return 33
-    elif atom == 'Se':
-        return 34
-    elif atom == 'Br':
-        return 35
-    elif atom == 'Kr':
-        return 36
-    elif atom == 'Rb':
-        return 37
-    elif atom == 'Sr':
-        return 38
-    elif atom == 'Y':
-        return 39
-    elif atom == 'Zr':
-        return 40
-    elif atom == 'Nb':
-        return 41
-    elif atom == 'Mo':
-        return 42
-    elif atom == 'Tc':
-        return 43
-    elif atom == 'Ru':
-        return 44
-    elif atom == 'Rh':
-        return 45
-    elif atom == 'Pd':
-        return 46
-    elif atom == 'Ag':
-        return 47
-    elif atom == 'Cd':
-        return 48
-    elif atom == 'In':
-        return 49
-    elif atom == 'Sn':
-        return 50
-    elif atom == 'Sb':
-        return 51
-    elif atom == 'Te':
-        return 52
-    elif atom == 'I':
-        return 53
-    elif atom == 'Xe':
-        return 54
-    elif atom == 'Cs':
-        return 55
-    elif atom == 'Ba':
-        return 56
-    elif atom == 'La':
-        return 57
-    elif atom == 'Ce':
-        return 58
-    elif atom == 'Pr':
-        return 59
-    elif atom == 'Nd':
-        return 60
-    elif atom == 'Pm':
-        return 61
-    elif atom == 'Sm':
-        return 62
-    elif atom == 'Eu':
-        return 63
-    elif atom == 'Gd':
-        return 64
-    elif atom == 'Tb':
-        return 65
-    elif atom == 'Dy':
-        return 66
-    elif atom == 'Ho':
-        return 67
-    elif atom == 'Er':
-        return 68
-    elif atom == 'Tm':
-        return 69
-    elif atom == 'Yb':
-        return 70
-    elif atom == 'Lu':
-        return 71
-    elif atom == 'Hf':
-        return 72
-    elif atom == 'Ta':
-        return 73
-    elif atom == 'W':
-        return 74
-    elif atom == 'Re':
-        return 75
-    elif atom == 'Os':
-        return 76
-    elif atom == 'Ir':
-        return 77
-    elif atom == 'Pt':
-        return 78
-    elif atom == 'Au':
-        return 79
-    elif atom == 'Hg':
-        return 80
-    elif atom == 'Tl':
-        return 81
-    elif atom == 'Pb':
-        return 82
-    elif atom == 'Bi':
-        return 83
-    elif atom == 'Po':
-        return 84
-    elif atom == 'At':
-        return 85
-    elif atom == 'Rn':
-        return 86
-    elif atom == 'Fr':
-        return 87
-    elif atom == 'Ra':
-        return 88
-    elif atom == 'Ac':
-        return 89
-    elif atom == 'Th':
-        return 90
-    elif atom == 'Pa':
-        return 91
-    elif atom == 'U':
-        return 92
-    elif atom == 'Np':
-        return 93
-    elif atom == 'Pu':
-        return 94
-    elif atom == 'Am':
-        return 95
-    elif atom == 'Cm':
-        return 96
-    elif atom == 'Bk':
-        return 97
-    elif atom == 'Cf':
-        return 98
-    elif atom == 'Es':
-        return 99
-    elif atom == 'Fm':
-        return 100
-    elif atom == 'Md':
-        return 101
-    elif atom == 'No':
-        return 102
-    elif atom == 'Lr':
-        return 103
-    elif atom == 'Rf':
-        return 104
-    elif atom == 'Db':
-        return 105
-    elif atom == 'Sg':
-        return 106
-    elif atom == 'Bh':
-        return 107
-    elif atom == 'Hs':
-        return 108
-    elif atom == 'Mt':
-        return 109
-    elif atom == 'Ds':
-        return 110
-    elif atom == 'Rg':
-        return 111
-    elif atom == 'Cn':
-        return 112
-    elif atom == 'Nh':
-        return 113
-    elif atom == 'Fl':
-        return 114
-    elif atom == 'Mc':
-        return 115
-    elif atom == 'Lv':
-        return 116
-    elif atom == 'Ts':
-        return 117
-    elif atom == 'Og':
-        return 118
-    else:
-        return None
-        
\ No newline at end of file
+    return ATOMIC_NUMBERS.get(atom) or None
@@ -1,99 +1,95 @@
 import re
 
-import numpy as np
+from .cache import _cached_molecules
+from .molecule import Molecule, _check_fields, _lazy
+from ._blocks import _iter_blocks
+from ._follow import _ListFollower
+from ._molecule_list import _MoleculeList
+from ._numeric import _read_coords, _read_floats
+from ._open import _is_compressed, _open_text
+from ._trajectory import _write_gv, _write_xyz
 
-from .data import atomic_number
-from .molecule import Molecule
 
+class EQList(_MoleculeList):
 
-class EQList:
-
-    def __init__(self, name=None, molecules=None):
-        self.name = name
-        self.molecules = molecules
+    prefix = "EQ"
     
-    def __len__(self):
-        return len(self.molecules)
+    def to_gv(self, path):
+        _write_gv(path, self)
     
-    def __getitem__(self, item):
-        return self.molecules[item]
+    def to_xyz(self, path, extended=False):
+        """
+        Write a multi-frame XYZ file, or extended XYZ with the energies in the comment lines.
+        """
+        _write_xyz(path, self, extended)
     
-    def to_gv(self, path):
-        num = len(self.molecules)
-        lines = [" #p\n", " \n"]
-        
-        for i, molecule in enumerate(self.molecules):
-            lines += [
-                " GradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGrad\n",
-                "                          Input orientation:                          \n",
-                " ---------------------------------------------------------------------\n",
-                " Center     Atomic      Atomic             Coordinates (Angstroms)    \n",
-                " Number     Number       Type             X           Y           Z   \n",
-                " ---------------------------------------------------------------------\n",
-                " ---------------------------------------------------------------------\n",
-                " \n",
-                " GradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGrad\n",
-                f" Step number   1 out of a maximum of   2 on scan point {i+1:5d} out of {num:5d}\n",
-                " \n",
-                " GradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGrad\n",
-                "                          Input orientation:                          \n",
-                " ---------------------------------------------------------------------\n",
-                " Center     Atomic      Atomic             Coordinates (Angstroms)    \n",
-                " Number     Number       Type             X           Y           Z   \n",
-                " ---------------------------------------------------------------------\n",
-                *[
-                    f"{i+1:7d} {atomic_number(sym):10d}           0     {coord[0]:11.6f} {coord[1]:11.6f} {coord[2]:11.6f}\n"
-                    for i, (sym, coord) in enumerate(zip(molecule.symbols, molecule.atomcoords))
-                ],
-                " ---------------------------------------------------------------------\n",
-                f" SCF Done:  E({molecule.functional}) = {molecule.scfenergy:15.12f}     A.U.\n",
-                " \n",
-                " GradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGrad\n",
-                f" Step number   2 out of a maximum of   2 on scan point {i+1:5d} out of {num:5d}\n",
-                " \n",
-            ]
-        
-        lines += [
-            " GradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGrad\n",
-            " Normal termination of Gaussian 16\n"
-        ]
-        
-        with open(path, "w") as f:
-            f.writelines(lines)
+    def _read_block(self, lines):
+        return _read_eq_block(lines, self._fields)
 
 
-def read_eq_list(path):
+class EQListFollower(_ListFollower):
+    """
+    Follow an _EQ_list.log that is still being written. poll() returns the newly added EQs.
+    """
     
-    with open(path, "r") as f:
-        lines = f.readlines()
+    def _complete(self, lines):
+        """
+        The last EQ is complete when all eigenvalues announced by "nmode = n" have been written.
+        """
+        for i, line in enumerate(lines):
+            if m := re.search(r"nmode\s*=\s*(\d+)", line):
+                return len("".join(lines[i + 1:]).split()) >= int(m.group(1))
+        return False
     
-    indices_num = [i for i, line in enumerate(lines) if line.startswith("#")]
-    indices_num.append(len(lines))
-    molecules = []
-    
-    for i, j in zip(indices_num, indices_num[1:]):
-        lines_eq = lines[i:j]
-        name = "EQ" + re.search(r"EQ (\d+),", lines_eq[0]).group(1)
-        index_energy = [i for i, line in enumerate(lines_eq) if line.startswith("Energy")][0]
-        lines_coord = lines_eq[1:index_energy]
-        symbols = [line.split()[0] for line in lines_coord]
-        atomcoords = np.array([list(map(float, line.split()[1:4])) for line in lines_coord])
-        scfenergy = float(re.search(r"\(\s*(-?\d+\.?\d+)\s*:", lines_eq[index_energy]).group(1))
-        afirenergy = float(re.search(r"=\s*(-?\d+\.?\d+)\s*\(", lines_eq[index_energy]).group(1))
-        mult = float(re.search(r"=\s*(-?\d+\.?\d+)", lines_eq[index_energy + 1]).group(1))
-        zpve = float(re.search(r"=\s*(-?\d+\.?\d+)", lines_eq[index_energy + 2]).group(1))
-        lines_nmeigen = lines_eq[index_energy + 4:]
-        nmeigen = np.concatenate([list(map(float, line.split())) for line in lines_nmeigen])
-        molecule = Molecule(
-            name=name,
-            mult=mult,
-            symbols=symbols,
-            atomcoords=atomcoords,
-            scfenergy=scfenergy,
-            afirenergy=afirenergy,
-            zpve=zpve,
-            nmeigen=nmeigen,
-        )
-        molecules.append(molecule)
-    
-    return EQList(name=path, molecules=molecules)
\ No newline at end of file
+    def _read_block(self, lines):
+        return _read_eq_block(lines, self._fields)
+
+
+def _read_eq_block(lines_eq, fields=None):
+    name = "EQ" + re.search(r"EQ (\d+),", lines_eq[0]).group(1)
+    index_energy = [i for i, line in enumerate(lines_eq) if line.startswith("Energy")][0]
+    lines_coord = lines_eq[1:index_energy]
+    symbols, atomcoords = _read_coords(lines_coord)
+    scfenergy = float(re.search(r"\(\s*(-?\d+\.?\d+)\s*:", lines_eq[index_energy]).group(1))
+    afirenergy = float(re.search(r"=\s*(-?\d+\.?\d+)\s*\(", lines_eq[index_energy]).group(1))
+    mult = float(re.search(r"=\s*(-?\d+\.?\d+)", lines_eq[index_energy + 1]).group(1))
+    zpve = float(re.search(r"=\s*(-?\d+\.?\d+)", lines_eq[index_energy + 2]).group(1))
+    lines_nmeigen = lines_eq[index_energy + 4:]
+    nmeigen = _lazy(fields, "nmeigen", _read_floats, lines_nmeigen)
+    return Molecule(
+        name=name,
+        mult=mult,
+        symbols=symbols,
+        atomcoords=atomcoords,
+        scfenergy=scfenergy,
+        afirenergy=afirenergy,
+        zpve=zpve,
+        nmeigen=nmeigen,
+    )
+
+
+def iter_eq_list(path, fields=None):
+    """
+    Yield one Molecule per "# Geometry of ..." block, reading the file incrementally.
+    nmeigen is decoded on first access. fields lists the fields to keep, but only nmeigen can be left out:
+    e.g. fields=("name", "scfenergy", "atomcoords") skips the eigenvalues and still parses every other field.
+    """
+    fields = _check_fields(fields)
+    with _open_text(path) as f:
+        for lines_eq in _iter_blocks(f):
+            yield _read_eq_block(lines_eq, fields)
+
+
+def read_eq_list(path, index=False, cache=None, fields=None):
+    """
+    path may be compressed (.gz, .xz, .bz2, .zst) and is then decompressed while it is parsed.
+    With index=True, only the byte offsets of the blocks are scanned (and saved to a sidecar
+    "<path>.idx.npz" for reuse) and each structure is parsed when it is accessed (ignored for compressed files).
+    cache is a ParseCache, None for the one set by enable_cache (if any) or False for no cache.
+    fields is passed to iter_eq_list.
+    """
+    fields = _check_fields(fields)
+    if index and not _is_compressed(path):
+        return EQList.from_index(path, fields=fields)
+    molecules = _cached_molecules("eq_list", path, cache, lambda: list(iter_eq_list(path, fields)), fields)
+    return EQList.from_molecules(molecules, name=path)
\ No newline at end of file
@@ -1,17 +1,85 @@
 import numpy as np
-from scipy.spatial import distance
+from scipy.spatial import cKDTree, distance
 
-from .data import covalent_radius
+from .data import radii, symbols_to_z
+
+
+# Above this many atoms, bonded pairs are searched with a KD-tree instead of from all pair distances.
+_KDTREE_MIN_ATOMS = 128
+
+# Number of pair distances evaluated at once when a stack is searched densely.
+_CHUNK_PAIRS = 1 << 22
 
 
 def get_adj_matrix(symbols, atomcoords, threshold=1.25):
     arr_distance = distance.cdist(atomcoords, atomcoords)
-    arr_radius = np.array([covalent_radius(s) for s in symbols])
+    arr_radius = radii(symbols_to_z(symbols))
     arr_radius = arr_radius[:, None] + arr_radius[None, :]
     arr_adj = (arr_distance < arr_radius * threshold).astype(int)
     return arr_adj
 
 
+def get_bonds(symbols, atomcoords, threshold=1.25):
+    """
+    Returns the bonded atom pairs as an (n_bonds, 2) array of 0-based indices i < j, sorted.
+    Uses the same criterion as get_adj_matrix without building the dense matrix.
+    """
+    pairs, _ = get_bonds_batch(symbols, np.asarray(atomcoords)[None], threshold)
+    return pairs
+
+
+def get_bonds_batch(symbols, coords, threshold=1.25):
+    """
+    Bonded atom pairs of a (n_structures, n_atoms, 3) stack of structures with the same symbols.
+    Returns the concatenated (n_bonds, 2) pairs and the (n_structures + 1,) offsets of each structure.
+    """
+    coords = np.asarray(coords, dtype=float)
+    arr_radius = radii(symbols_to_z(symbols))
+    
+    if len(arr_radius) > _KDTREE_MIN_ATOMS:
+        chunks = [_bonds_kdtree(arr_radius, atomcoords, threshold) for atomcoords in coords]
+        counts = np.array([len(chunk) for chunk in chunks], dtype=np.int64)
+    else:
+        chunks, counts = _bonds_dense(arr_radius, coords, threshold)
+    
+    offsets = np.zeros(len(coords) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    pairs = np.concatenate(chunks) if chunks else np.empty((0, 2), dtype=np.intp)
+    return pairs, offsets
+
+
+def _bonds_dense(arr_radius, coords, threshold):
+    """
+    Compares all pair distances with the cutoffs, for chunks of structures at once.
+    """
+    i, j = np.triu_indices(len(arr_radius), 1)
+    cutoff = (arr_radius[i] + arr_radius[j]) * threshold
+    step = max(1, _CHUNK_PAIRS // max(len(i), 1))
+    
+    chunks = []
+    counts = []
+    for start in range(0, len(coords), step):
+        diff = coords[start:start + step, i] - coords[start:start + step, j]
+        bonded = np.sqrt(np.einsum("fpk,fpk->fp", diff, diff)) < cutoff
+        frames, p = np.nonzero(bonded)
+        chunks.append(np.stack([i[p], j[p]], axis=1))
+        counts.append(np.bincount(frames, minlength=len(bonded)))
+    return chunks, np.concatenate(counts) if counts else np.empty(0, dtype=np.int64)
+
+
+def _bonds_kdtree(arr_radius, atomcoords, threshold):
+    """
+    Finds candidate pairs within the largest possible cutoff, then applies the per-pair cutoffs.
+    """
+    tree = cKDTree(atomcoords)
+    candidates = tree.query_pairs(2 * arr_radius.max() * threshold, output_type="ndarray")
+    i, j = candidates[:, 0], candidates[:, 1]
+    d = np.sqrt(np.sum((atomcoords[i] - atomcoords[j]) ** 2, axis=1))
+    bonded = d < (arr_radius[i] + arr_radius[j]) * threshold
+    pairs = candidates[bonded]
+    return pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))]
+
+
 def get_distance(atomcoords, label0, label1):
     d = np.sqrt(np.sum((atomcoords[label0 - 1] - atomcoords[label1 - 1]) ** 2))
     return d
@@ -39,4 +107,107 @@ def get_dihedral_angle(atomcoords, label0, label1, label2, label3):
     sign = np.sign(np.dot(np.cross(n0, n1), C - B))
     theta *= sign
     angle = np.degrees(theta)
-    return angle
\ No newline at end of file
+    return angle
+
+
+def get_distances(atomcoords, labels):
+    """
+    Distances of the (K, 2) atom label pairs, 1-based as in get_distance.
+    atomcoords is one structure (n, 3) or a frame stack (F, n, 3); returns (K,) or (F, K).
+    """
+    A, B = _select(atomcoords, labels, 2)
+    return np.linalg.norm(A - B, axis=-1)
+
+
+def get_angles(atomcoords, labels):
+    """
+    Angles A-B-C in ° of the (K, 3) atom labels, for one structure or a frame stack.
+    """
+    A, B, C = _select(atomcoords, labels, 3)
+    u = A - B
+    v = C - B
+    return np.degrees(np.arctan2(np.linalg.norm(np.cross(u, v), axis=-1), np.sum(u * v, axis=-1)))
+
+
+def get_dihedral_angles(atomcoords, labels):
+    """
+    Signed dihedral angles A-B-C-D in ° of the (K, 4) atom labels, for one structure or a frame stack.
+    Same convention as get_dihedral_angle, computed with arctan2 so that angles near 0° and 180° keep their precision.
+    """
+    A, B, C, D = _select(atomcoords, labels, 4)
+    n0 = np.cross(B - A, C - A)
+    n1 = np.cross(C - B, D - B)
+    b = C - B
+    b = b / np.linalg.norm(b, axis=-1)[..., None]
+    return np.degrees(np.arctan2(np.sum(np.cross(n0, n1) * b, axis=-1), np.sum(n0 * n1, axis=-1)))
+
+
+def get_wilson_b_matrix(atomcoords, bonds=(), angles=(), dihedrals=()):
+    """
+    Wilson B-matrix, the derivatives of the internal coordinates with respect to the Cartesian coordinates.
+    Rows are the bonds (Å/Å), then the angles and the dihedrals (rad/Å), with 1-based atom labels.
+    Returns (K, 3n) for one structure or (F, K, 3n) for a frame stack.
+    """
+    atomcoords = np.asarray(atomcoords, dtype=float)
+    shape = atomcoords.shape[:-2]
+    atomcoords = atomcoords.reshape(-1, *atomcoords.shape[-2:])
+    bonds = np.asarray(bonds, dtype=int).reshape(-1, 2)
+    angles = np.asarray(angles, dtype=int).reshape(-1, 3)
+    dihedrals = np.asarray(dihedrals, dtype=int).reshape(-1, 4)
+    
+    n_atoms = atomcoords.shape[-2]
+    n_rows = len(bonds) + len(angles) + len(dihedrals)
+    wilson = np.zeros((len(atomcoords), n_rows, n_atoms, 3))
+    rows = np.arange(n_rows)
+    
+    def scatter(labels, offset, derivatives):
+        for column, derivative in zip(labels.T - 1, derivatives):
+            wilson[:, rows[offset:offset + len(labels)], column] = derivative
+    
+    A, B = _select(atomcoords, bonds, 2)
+    u = _unit(A - B)
+    scatter(bonds, 0, (u, -u))
+    
+    A, B, C = _select(atomcoords, angles, 3)
+    u = A - B
+    v = C - B
+    lu = np.linalg.norm(u, axis=-1)[..., None]
+    lv = np.linalg.norm(v, axis=-1)[..., None]
+    cos = np.sum(u * v, axis=-1)[..., None] / (lu * lv)
+    sin = np.sqrt(np.clip(1 - cos ** 2, 0, None))
+    dA = (cos * u / lu - v / lv) / (lu * sin)
+    dC = (cos * v / lv - u / lu) / (lv * sin)
+    scatter(angles, len(bonds), (dA, -dA - dC, dC))
+    
+    # Blondel and Karplus, J. Comput. Chem. 1996, 17, 1132-1141.
+    A, B, C, D = _select(atomcoords, dihedrals, 4)
+    F = A - B
+    G = B - C
+    H = D - C
+    a = np.cross(F, G)
+    b = np.cross(H, G)
+    la2 = np.sum(a * a, axis=-1)[..., None]
+    lb2 = np.sum(b * b, axis=-1)[..., None]
+    lg = np.linalg.norm(G, axis=-1)[..., None]
+    fg = np.sum(F * G, axis=-1)[..., None]
+    hg = np.sum(H * G, axis=-1)[..., None]
+    dA = -lg / la2 * a
+    dD = lg / lb2 * b
+    dB = -dA + fg / (la2 * lg) * a - hg / (lb2 * lg) * b
+    dC = -dD - fg / (la2 * lg) * a + hg / (lb2 * lg) * b
+    scatter(dihedrals, len(bonds) + len(angles), (dA, dB, dC, dD))
+    
+    return wilson.reshape(shape + (n_rows, 3 * n_atoms))
+
+
+def _select(atomcoords, labels, n_labels):
+    """
+    Returns the coordinates of each column of 1-based labels, each (..., K, 3).
+    """
+    atomcoords = np.asarray(atomcoords, dtype=float)
+    labels = np.asarray(labels, dtype=int).reshape(-1, n_labels)
+    return [atomcoords[..., column - 1, :] for column in labels.T]
+
+
+def _unit(v):
+    return v / np.linalg.norm(v, axis=-1)[..., None]
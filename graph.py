@@ -0,0 +1,118 @@
+import networkx as nx
+import numpy as np
+from scipy import sparse
+from scipy.sparse.csgraph import connected_components
+
+
+class ReactionGraph:
+    """
+    Array-backed graph of the EQs (nodes) and TSs (edges) of a ReactionPathNetwork.
+    Node i is eq_list[i] and edge e is pt_list[e], so the node and edge attributes are the columns of the lists
+    (e.g. eq_list.energies, pt_list.zpves) rather than copies. TSs to an EQ that is not in eq_list (EQ??)
+    have source and target -1 and are left out of the adjacency.
+    The adjacency is CSR over both directions: the neighbours of node i are indices[indptr[i]:indptr[i + 1]],
+    reached through the edges edge_ids[indptr[i]:indptr[i + 1]]. A TS back to the same EQ is listed once.
+    """
+    
+    def __init__(self, eq_list, pt_list):
+        self.eq_list = eq_list
+        self.pt_list = pt_list
+        self.names = eq_list.names
+        self.ts_names = pt_list.names
+        self._order = np.argsort(self.names, kind="stable")
+    
+        connections = pt_list.connections
+        if connections is None:
+            connections = np.empty((0, 2), dtype=str)
+        self.source = self.positions(connections[:, 0])
+        self.target = self.positions(connections[:, 1])
+        self.valid = (self.source >= 0) & (self.target >= 0)
+    
+        edges = np.flatnonzero(self.valid)
+        loops = self.source[edges] == self.target[edges]
+        heads = np.concatenate([self.source[edges], self.target[edges[~loops]]])
+        tails = np.concatenate([self.target[edges], self.source[edges[~loops]]])
+        order = np.argsort(heads, kind="stable")
+        self.indptr = np.zeros(self.n_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(heads, minlength=self.n_nodes), out=self.indptr[1:])
+        self.indices = tails[order]
+        self.edge_ids = np.concatenate([edges, edges[~loops]])[order]
+    
+    @property
+    def n_nodes(self):
+        return len(self.names)
+    
+    @property
+    def n_edges(self):
+        return len(self.ts_names)
+    
+    def positions(self, names):
+        """
+        Node ids of an array of EQ names, -1 for names that are not in eq_list.
+        """
+        if self.n_nodes == 0:
+            return np.full(len(names), -1, dtype=np.int64)
+        sorted_names = self.names[self._order]
+        found = np.minimum(np.searchsorted(sorted_names, names), self.n_nodes - 1)
+        return np.where(sorted_names[found] == names, self._order[found], -1).astype(np.int64)
+    
+    def position(self, name):
+        """
+        Returns the node id of the EQ called name, e.g. "EQ12".
+        """
+        node = self.positions(np.array([name]))[0]
+        if node < 0:
+            raise KeyError(name)
+        return int(node)
+    
+    def neighbours(self, node):
+        """
+        Returns the neighbouring node ids of node and the ids of the edges to them (views of the adjacency).
+        """
+        start, stop = self.indptr[node], self.indptr[node + 1]
+        return self.indices[start:stop], self.edge_ids[start:stop]
+    
+    def node_energies(self, zpve=True):
+        """
+        scfenergy (+ zpve, taken as zero where missing) of every node.
+        """
+        return _energies(self.eq_list, zpve)
+    
+    def edge_energies(self, zpve=True):
+        """
+        scfenergy (+ zpve, taken as zero where missing) of every edge.
+        """
+        return _energies(self.pt_list, zpve)
+    
+    def adjacency_matrix(self):
+        """
+        scipy CSR matrix with the number of edges between two nodes, sharing indptr and indices with the graph.
+        """
+        data = np.ones(len(self.indices))
+        return sparse.csr_matrix((data, self.indices, self.indptr), shape=(self.n_nodes, self.n_nodes))
+    
+    def components(self):
+        """
+        Connected component label of every node.
+        """
+        return connected_components(self.adjacency_matrix(), directed=False)[1]
+    
+    def to_networkx(self):
+        """
+        networkx.MultiGraph with the EQ names as nodes and the to_dict() of every EQ and TS as attributes.
+        """
+        G = nx.MultiGraph()
+        G.add_nodes_from((eq.name, eq.to_dict()) for eq in self.eq_list)
+        names = self.names.tolist()
+        edges = np.flatnonzero(self.valid).tolist()
+        G.add_edges_from(
+            (names[self.source[e]], names[self.target[e]], self.pt_list[e].to_dict()) for e in edges
+        )
+        return G
+
+
+def _energies(molecule_list, zpve):
+    energies = np.asarray(molecule_list.energies, dtype=float)
+    if zpve:
+        energies = energies + np.nan_to_num(np.asarray(molecule_list.zpves, dtype=float))
+    return energies
@@ -0,0 +1,151 @@
+import concurrent.futures
+import fnmatch
+import os
+
+from .cache import _resolve
+from .eq_list import EQList, read_eq_list
+from .lup_ts import LUPTS, read_lup_ts
+from .min import MIN, read_min
+from .pt_list import PTList, read_pt_list
+from ._open import _strip_compressed_suffix
+from ._packing import _pack_molecules, _unpack_molecules
+
+
+# File name patterns of the recognised GRRM outputs, checked in this order.
+PATTERNS = (
+    ("eq_list", "*_EQ_list.log"),
+    ("ts_list", "*_TS_list.log"),
+    ("pt_list", "*_PT_list.log"),
+    ("lup", "*_LUP*.log"),
+    ("min", "*_MIN*.log"),
+)
+
+
+class GRRMJob:
+    
+    def __init__(self, path, eq_list=None, ts_list=None, pt_list=None, lups=None, mins=None, errors=None):
+        self.path = path
+        self.eq_list = eq_list
+        self.ts_list = ts_list
+        self.pt_list = pt_list
+        self.lups = {} if lups is None else lups  # file name -> LUPTS
+        self.mins = {} if mins is None else mins  # file name -> MIN
+        self.errors = {} if errors is None else errors  # file name -> exception
+
+
+def find_outputs(path, patterns=PATTERNS):
+    """
+    Returns (kind, file path) of the recognised GRRM outputs in the directory path.
+    Compressed outputs (e.g. _EQ_list.log.gz) are recognised as well.
+    """
+    outputs = []
+    
+    for file_name in sorted(os.listdir(path)):
+        for kind, pattern in patterns:
+            if fnmatch.fnmatchcase(_strip_compressed_suffix(file_name), pattern):
+                outputs.append((kind, os.path.join(path, file_name)))
+                break
+    
+    return outputs
+
+
+def load_job(path, workers=None, errors="raise", patterns=PATTERNS, cache=None, fields=None):
+    return load_jobs([path], workers=workers, errors=errors, patterns=patterns, cache=cache, fields=fields)[0]
+
+
+def load_jobs(paths, workers=None, errors="raise", patterns=PATTERNS, cache=None, fields=None):
+    """
+    Parse all recognised outputs of the job directories in a process pool.
+    workers=None uses os.cpu_count() processes and workers=1 parses in this process.
+    With errors="ignore", files that fail to parse are recorded in GRRMJob.errors instead of raising.
+    cache and fields are passed to the readers (see read_eq_list).
+    """
+    if errors not in ("raise", "ignore"):
+        raise ValueError(f"errors must be 'raise' or 'ignore', not {errors!r}")
+    
+    cache = _resolve(cache) or False
+    tasks = [(i, kind, file_path) for i, path in enumerate(paths) for kind, file_path in find_outputs(path, patterns)]
+    jobs = [GRRMJob(path) for path in paths]
+    
+    if workers == 1:
+        for task in tasks:
+            result, exception = _capture(_read, *task[1:], cache, fields)
+            _assemble(jobs, task, result, exception, errors, packed=False)
+        return jobs
+    
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_load_file, kind, file_path, cache, fields) for _, kind, file_path in tasks]
+        
+        # Assembled in task order, so that mins and lups are ordered as with workers=1.
+        for task, future in zip(tasks, futures):
+            exception = future.exception()
+            if exception is not None and errors == "raise":
+                executor.shutdown(cancel_futures=True)
+            _assemble(jobs, task, None if exception else future.result(), exception, errors, packed=True)
+    
+    return jobs
+
+
+_READERS = {
+    "eq_list": read_eq_list,
+    "ts_list": read_pt_list,
+    "pt_list": read_pt_list,
+    "lup": read_lup_ts,
+    "min": read_min,
+}
+
+
+def _read(kind, path, cache, fields):
+    return _READERS[kind](path, cache=cache, fields=fields)
+
+
+def _capture(function, *args):
+    try:
+        return function(*args), None
+    except Exception as exception:
+        return None, exception
+
+
+def _load_file(kind, path, cache, fields):
+    """
+    Parse one file in a worker and return it as packed arrays, which are much cheaper
+    to send back to the parent than pickled Molecule objects.
+    """
+    result = _read(kind, path, cache, fields)
+    
+    if kind == "min":
+        return _pack_molecules(result.itrs + [result.optimized])
+    elif kind == "lup":
+        return _pack_molecules(result.irc)
+    else:
+        return _pack_molecules(list(result))
+
+
+def _assemble(jobs, task, result, exception, errors, packed):
+    i, kind, path = task
+    job = jobs[i]
+    file_name = os.path.basename(path)
+    
+    if exception is not None:
+        if errors == "raise":
+            raise exception
+        job.errors[file_name] = exception
+        return
+    
+    if packed:
+        molecules = _unpack_molecules(result)
+        if kind == "min":
+            result = MIN(itrs=molecules[:-1], optimized=molecules[-1])
+        elif kind == "lup":
+            result = LUPTS(irc=molecules)
+        elif kind == "eq_list":
+            result = EQList.from_molecules(molecules, name=path)
+        else:
+            result = PTList.from_molecules(molecules, name=path)
+    
+    if kind == "min":
+        job.mins[file_name] = result
+    elif kind == "lup":
+        job.lups[file_name] = result
+    else:
+        setattr(job, kind, result)
@@ -0,0 +1,125 @@
+import numpy as np
+from scipy import sparse
+from scipy.integrate import solve_ivp
+from scipy.sparse.csgraph import connected_components
+from scipy.sparse.linalg import expm_multiply
+
+
+BOLTZMANN = 1.380649e-23  # J/K
+PLANCK = 6.62607015e-34  # J s
+HARTREE = 4.3597447222071e-18  # J
+
+METHODS = ("bdf", "expm")
+
+
+def eyring_rates(barriers, temperature=298.15):
+    """
+    Eyring (TST) rate constants in 1/s of barriers in Hartree, vectorized. Negative barriers are taken as zero.
+    """
+    kT = BOLTZMANN * temperature
+    return kT / PLANCK * np.exp(-np.clip(np.asarray(barriers, dtype=float), 0, None) * HARTREE / kT)
+
+
+class Kinetics:
+    """
+    Master equation dP/dt = K P of the EQs of a ReactionPathNetwork, with Eyring rates through every TS.
+    Energies are scfenergy + zpve (zpve is taken as zero where missing, or everywhere with zpve=False).
+    """
+    
+    def __init__(self, network, temperature=298.15, zpve=True):
+        self.temperature = temperature
+        graph = network.graph
+        self.names = graph.names.tolist()
+        self.energies = graph.node_energies(zpve)
+    
+        # TSs to an unknown EQ (EQ??) and TSs that return to the same EQ do not change the populations.
+        valid = graph.valid & (graph.source != graph.target)
+        self.ts_names = graph.ts_names[valid].tolist()
+        self.source = graph.source[valid]
+        self.target = graph.target[valid]
+        # A TS below one of its EQs is raised to the higher EQ, which keeps the ratio of the rates (detailed balance).
+        ts_energies = np.maximum.reduce(
+            [graph.edge_energies(zpve)[valid], self.energies[self.source], self.energies[self.target]]
+        )
+        self.forward_rates = eyring_rates(ts_energies - self.energies[self.source], temperature)
+        self.backward_rates = eyring_rates(ts_energies - self.energies[self.target], temperature)
+        self.matrix = self._rate_matrix()
+    
+    def _rate_matrix(self):
+        """
+        CSR matrix K with K[j, i] the total rate from EQ i to EQ j and -(outflow of i) on the diagonal.
+        Parallel TSs between the same EQs are summed.
+        """
+        n = len(self.names)
+        rows = np.concatenate([self.target, self.source])
+        columns = np.concatenate([self.source, self.target])
+        rates = np.concatenate([self.forward_rates, self.backward_rates])
+        outflow = np.bincount(columns, weights=rates, minlength=n)
+        return sparse.csr_matrix(
+            (np.concatenate([rates, -outflow]), (np.concatenate([rows, np.arange(n)]), np.concatenate([columns, np.arange(n)]))),
+            shape=(n, n),
+        )
+    
+    def initial(self, populations):
+        """
+        Population vector from a name (all in that EQ), a dict of names and populations, or an array.
+        """
+        if isinstance(populations, str):
+            populations = {populations: 1.0}
+        if isinstance(populations, dict):
+            vector = np.zeros(len(self.names))
+            positions = {name: i for i, name in enumerate(self.names)}
+            for name, population in populations.items():
+                vector[positions[name]] += population
+            return vector
+        return np.asarray(populations, dtype=float)
+    
+    def populations(self, times, initial, method="bdf", rtol=1e-6, atol=1e-12):
+        """
+        Populations (len(times), n_eqs) at times in s, from the initial populations at t = 0.
+        method "bdf" integrates the stiff ODE with scipy's BDF and the sparse Jacobian K. Its steps are limited
+        by the fastest rates, so the run time grows with the time span; for the populations at long times use steady_state.
+        "expm" propagates each interval with scipy.sparse.linalg.expm_multiply, whose cost grows with |K| t,
+        so it only suits times comparable to the inverse of the fastest rates.
+        """
+        times = np.asarray(times, dtype=float)
+        p = self.initial(initial)
+        if method == "bdf":
+            solution = solve_ivp(
+                lambda t, p: self.matrix @ p,
+                (0.0, times.max(initial=0.0)),
+                p,
+                method="BDF",
+                t_eval=np.sort(times),
+                jac=self.matrix,
+                rtol=rtol,
+                atol=atol,
+            )
+            if not solution.success:
+                raise RuntimeError(solution.message)
+            order = np.argsort(np.argsort(times, kind="stable"), kind="stable")
+            return solution.y.T[order]
+        if method == "expm":
+            result = np.empty((len(times), len(p)))
+            t = 0.0
+            for k in np.argsort(times, kind="stable").tolist():
+                if times[k] > t:
+                    p = expm_multiply(self.matrix * (times[k] - t), p)
+                    t = times[k]
+                result[k] = p
+            return result
+        raise ValueError(f"Unknown method: {method}")
+    
+    def steady_state(self, initial):
+        """
+        Steady-state populations. Every TS couples both directions through the same barrier (detailed balance),
+        so each connected set of EQs ends in its Boltzmann distribution, holding the initial population of the set.
+        """
+        p = self.initial(initial)
+        _, component = connected_components(self.matrix, directed=False)
+        kT = BOLTZMANN * self.temperature
+        lowest = np.full(component.max(initial=-1) + 1, np.inf)
+        np.minimum.at(lowest, component, self.energies)
+        weights = np.exp(-(self.energies - lowest[component]) * HARTREE / kT)
+        mass = np.bincount(component, weights=p)
+        return mass[component] * weights / np.bincount(component, weights=weights)[component]
@@ -1,65 +1,67 @@
-from .data import atomic_number
+import numpy as np
+
+from .cache import _cached_molecules
+from .geometry import get_bonds_batch
+from .molecule import _check_fields
+from ._archived import _Archived
+from ._bond_changes import _bond_changes
+from ._open import _open_text
 from ._ircirc import _read_ircirc
+from ._trajectory import _write_gv, _write_xyz
 
 
-class LUPTS:
+class LUPTS(_Archived):
 
     def __init__(self, name=None, irc=None):
         self.name = name
         self.irc = irc
         
-    def to_gv(self, path, reverse=False):
+    def bond_switches(self, threshold=1.25, reverse=False):
+        """
+        Frames of the IRC where bonds form or break, compared with the previous frame.
+        Returns a dict of columns "frame" (position in irc), "name", "atom0", "atom1" (1-based labels)
+        and "change" (1 formed, -1 broken).
+        End points whose optimization did not finish have no coordinates and are skipped.
+        """
         irc = self.irc[::-1] if reverse else self.irc
-        num = len(irc)
-        lines = [" #p\n", " \n"]
-        
-        for i, molecule in enumerate(irc):
-            lines += [
-                " GradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGrad\n",
-                "                          Input orientation:                          \n",
-                " ---------------------------------------------------------------------\n",
-                " Center     Atomic      Atomic             Coordinates (Angstroms)    \n",
-                " Number     Number       Type             X           Y           Z   \n",
-                " ---------------------------------------------------------------------\n",
-                " ---------------------------------------------------------------------\n",
-                " \n",
-                " GradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGrad\n",
-                f" Step number   1 out of a maximum of   2 on scan point {i+1:5d} out of {num:5d}\n",
-                " \n",
-                " GradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGrad\n",
-                "                          Input orientation:                          \n",
-                " ---------------------------------------------------------------------\n",
-                " Center     Atomic      Atomic             Coordinates (Angstroms)    \n",
-                " Number     Number       Type             X           Y           Z   \n",
-                " ---------------------------------------------------------------------\n",
-                *[
-                    f"{i+1:7d} {atomic_number(sym):10d}           0     {coord[0]:11.6f} {coord[1]:11.6f} {coord[2]:11.6f}\n"
-                    for i, (sym, coord) in enumerate(zip(molecule.symbols, molecule.atomcoords))
-                ],
-                " ---------------------------------------------------------------------\n",
-                f" SCF Done:  E({molecule.functional}) = {molecule.scfenergy:15.12f}     A.U.\n",
-                " \n",
-                " GradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGrad\n",
-                f" Step number   2 out of a maximum of   2 on scan point {i+1:5d} out of {num:5d}\n",
-                " \n",
-            ]
-        
-        lines += [
-            " GradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGrad\n",
-            " Normal termination of Gaussian 16\n"
-        ]
-        
-        with open(path, "w") as f:
-            f.writelines(lines)
+        frames = np.array([k for k, molecule in enumerate(irc) if molecule.atomcoords is not None], dtype=np.int64)
+        symbols = irc[frames[0]].symbols if len(frames) else ()
+        coords = np.array([irc[k].atomcoords for k in frames.tolist()], dtype=float).reshape(len(frames), len(symbols), 3)
+        pairs, offsets = get_bonds_batch(symbols, coords, threshold)
+        steps = np.arange(max(len(frames) - 1, 0))
+        step, i, j, change = _bond_changes(pairs, offsets, len(symbols), steps, steps + 1)
+        frame = frames[step + 1]
+        return {
+            "frame": frame,
+            "name": np.array([irc[k].name for k in frame.tolist()], dtype=str),
+            "atom0": i + 1,
+            "atom1": j + 1,
+            "change": change,
+        }
+    
+    def to_gv(self, path, reverse=False):
+        _write_gv(path, self.irc[::-1] if reverse else self.irc)
+    
+    def to_xyz(self, path, reverse=False, extended=False):
+        """
+        Write a multi-frame XYZ file, or extended XYZ with the energies in the comment lines.
+        """
+        _write_xyz(path, self.irc[::-1] if reverse else self.irc, extended)
 
 
-def read_lup_ts(path):
+def read_lup_ts(path, cache=None, fields=None):
+    """
+    path may be compressed (.gz, .xz, .bz2, .zst) and is then decompressed while it is parsed.
+    cache is a ParseCache, None for the one set by enable_cache (if any) or False for no cache.
+    grads, hessian and nmeigen are decoded on first access. fields lists the fields to keep, but only these three
+    can be left out: e.g. fields=("name", "scfenergy", "atomcoords") skips them and still parses every other field.
+    """
+    fields = _check_fields(fields)
     
-    with open(path, "r") as f:
-        lines = f.readlines()
+    def read():
+        with _open_text(path) as f:
+            forward_step, _, forward_optimized, backward_step, _, backward_optimized = _read_ircirc(f, fields)
+        return [backward_optimized] + backward_step[::-1] + forward_step + [forward_optimized]
     
-    indices_ircirc = [i for i, line in enumerate(lines) if line.startswith("IRCIRC")]
-    lines_ircirc = lines[indices_ircirc[0]:indices_ircirc[1] + 1]
-    forward_step, _, forward_optimized, backward_step, _, backward_optimized = _read_ircirc(lines_ircirc)
-    irc = [backward_optimized] + backward_step[::-1] + forward_step + [forward_optimized]
+    irc = _cached_molecules("lup_ts", path, cache, read, fields)
     return LUPTS(irc=irc)
\ No newline at end of file
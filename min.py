@@ -1,8 +1,12 @@
-from .data import atomic_number
+from .cache import _cached_molecules
+from .molecule import _check_fields
+from ._archived import _Archived
+from ._open import _open_text
 from ._optopt import _read_optopt
+from ._trajectory import _write_gv, _write_xyz
 
 
-class MIN:
+class MIN(_Archived):
 
     def __init__(self, name=None, itrs=None, optimized=None):
         self.name = name
@@ -10,58 +14,31 @@ class MIN:
         self.optimized = optimized
 
     def to_gv(self, path):
-        num = len(self.itrs)
-        lines = [" #p\n", " \n"]
-        
-        for i, molecule in enumerate(self.itrs):
-            lines += [
-                " GradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGrad\n",
-                "                          Input orientation:                          \n",
-                " ---------------------------------------------------------------------\n",
-                " Center     Atomic      Atomic             Coordinates (Angstroms)    \n",
-                " Number     Number       Type             X           Y           Z   \n",
-                " ---------------------------------------------------------------------\n",
-                " ---------------------------------------------------------------------\n",
-                " \n",
-                " GradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGrad\n",
-                f" Step number   1 out of a maximum of   2 on scan point {i+1:5d} out of {num:5d}\n",
-                " \n",
-                " GradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGrad\n",
-                "                          Input orientation:                          \n",
-                " ---------------------------------------------------------------------\n",
-                " Center     Atomic      Atomic             Coordinates (Angstroms)    \n",
-                " Number     Number       Type             X           Y           Z   \n",
-                " ---------------------------------------------------------------------\n",
-                *[
-                    f"{i+1:7d} {atomic_number(sym):10d}           0     {coord[0]:11.6f} {coord[1]:11.6f} {coord[2]:11.6f}\n"
-                    for i, (sym, coord) in enumerate(zip(molecule.symbols, molecule.atomcoords))
-                ],
-                " ---------------------------------------------------------------------\n",
-                f" SCF Done:  E({molecule.functional}) = {molecule.scfenergy:15.12f}     A.U.\n",
-                " \n",
-                " GradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGrad\n",
-                f" Step number   2 out of a maximum of   2 on scan point {i+1:5d} out of {num:5d}\n",
-                " \n",
-            ]
-        
-        lines += [
-            " GradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGrad\n",
-            " Normal termination of Gaussian 16\n"
-        ]
-        
-        with open(path, "w") as f:
-            f.writelines(lines)
+        _write_gv(path, self.itrs)
+    
+    def to_xyz(self, path, extended=False):
+        """
+        Write a multi-frame XYZ file, or extended XYZ with the energies in the comment lines.
+        """
+        _write_xyz(path, self.itrs, extended)
 
 
-def read_min(path):
+def read_min(path, cache=None, fields=None):
+    """
+    path may be compressed (.gz, .xz, .bz2, .zst) and is then decompressed while it is parsed.
+    cache is a ParseCache, None for the one set by enable_cache (if any) or False for no cache.
+    grads, hessian and nmeigen are decoded on first access. fields lists the fields to keep, but only these three
+    can be left out: e.g. fields=("name", "scfenergy", "atomcoords") skips them and still parses every other field.
+    """
+    fields = _check_fields(fields)
     
-    with open(path, "r") as f:
-        lines = f.readlines()
+    def read():
+        with _open_text(path) as f:
+            itrs, optimized = _read_optopt(f, fields)
+        return itrs + [optimized]
     
-    indices_optopt = [i for i, line in enumerate(lines) if line.startswith("OPTOPT")]
-    lines_optopt = lines[indices_optopt[0]:indices_optopt[1] + 1]
-    itrs, optimized = _read_optopt(lines_optopt)
+    molecules = _cached_molecules("min", path, cache, read, fields)
     return MIN(
-        itrs=itrs,
-        optimized=optimized
+        itrs=molecules[:-1],
+        optimized=molecules[-1]
     )
\ No newline at end of file
@@ -1,5 +1,73 @@
+from ._numeric import _pack_tril, _unpack_tril
+
+
+# Defaults of the rarely set fields, which are only stored per instance when they differ.
+_DEFAULTS = {
+    "functional": "B3LYP",
+    "basis_set": "6-31G",
+    "comments": "title",
+}
+
+# Interned symbols tuples, so that structures with the same atoms share one object.
+_SYMBOLS = {}
+
+FIELDS = (
+    "name",
+    "functional",
+    "basis_set",
+    "comments",
+    "charge",
+    "mult",
+    "symbols",
+    "atomcoords",
+    "scfenergy",
+    "afirenergy",
+    "zpve",
+    "grads",
+    "hessian",
+    "nmeigen",
+    "connection",
+    "status",
+)
+
+# The fields that a fields= projection can leave out. All other fields are always parsed.
+SKIPPABLE_FIELDS = ("grads", "hessian", "nmeigen")
+
+
+class _Lazy:
+    """
+    A field that is decoded on first access.
+    """
+    
+    __slots__ = ("function", "args")
+    
+    def __init__(self, function, *args):
+        self.function = function
+        self.args = args
+    
+    def __call__(self):
+        return self.function(*self.args)
+
+
 class Molecule:
     
+    __slots__ = (
+        "name",
+        "charge",
+        "mult",
+        "_symbols",
+        "atomcoords",
+        "scfenergy",
+        "afirenergy",
+        "zpve",
+        "_grads",
+        "_hessian_packed",
+        "_nmeigen",
+        "connection",
+        "status",
+        "_extra",
+    )
+    
     def __init__(
         self,
         name=None,
@@ -19,6 +87,7 @@ class Molecule:
         connection=None,
         status=None,
     ):
+        self._extra = None
         self.name = name
         self.functional = functional
         self.basis_set = basis_set
@@ -36,6 +105,122 @@ class Molecule:
         self.connection = connection
         self.status = status
     
+    @property
+    def functional(self):
+        return self._get_extra("functional")
+    
+    @functional.setter
+    def functional(self, functional):
+        self._set_extra("functional", functional)
+    
+    @property
+    def basis_set(self):
+        return self._get_extra("basis_set")
+    
+    @basis_set.setter
+    def basis_set(self, basis_set):
+        self._set_extra("basis_set", basis_set)
+    
+    @property
+    def comments(self):
+        return self._get_extra("comments")
+    
+    @comments.setter
+    def comments(self, comments):
+        self._set_extra("comments", comments)
+    
+    @property
+    def symbols(self):
+        """
+        Interned tuple of the element symbols.
+        """
+        return self._symbols
+    
+    @symbols.setter
+    def symbols(self, symbols):
+        self._symbols = None if symbols is None else _intern_symbols(symbols)
+    
+    @property
+    def grads(self):
+        if type(self._grads) is _Lazy:
+            self._grads = self._grads()
+        return self._grads
+    
+    @grads.setter
+    def grads(self, grads):
+        self._grads = grads
+    
+    @property
+    def nmeigen(self):
+        if type(self._nmeigen) is _Lazy:
+            self._nmeigen = self._nmeigen()
+        return self._nmeigen
+    
+    @nmeigen.setter
+    def nmeigen(self, nmeigen):
+        self._nmeigen = nmeigen
+    
+    @property
+    def hessian_packed(self):
+        if type(self._hessian_packed) is _Lazy:
+            self._hessian_packed = self._hessian_packed()
+        return self._hessian_packed
+    
+    @property
+    def hessian(self):
+        """
+        Symmetric Hessian matrix, built on request from the packed lower triangle.
+        """
+        return None if self.hessian_packed is None else _unpack_tril(self.hessian_packed)
+    
+    @hessian.setter
+    def hessian(self, hessian):
+        """
+        Accepts a full (or lower-triangle) matrix or an already packed lower triangle.
+        """
+        if hessian is not None and type(hessian) is not _Lazy and hessian.ndim == 2:
+            hessian = _pack_tril(hessian)
+        self._hessian_packed = hessian
+    
+    def to_dict(self):
+        """
+        Returns the fields as a dict, e.g. for graph attributes.
+        """
+        return {
+            "name": self.name,
+            "functional": self.functional,
+            "basis_set": self.basis_set,
+            "comments": self.comments,
+            "charge": self.charge,
+            "mult": self.mult,
+            "symbols": self.symbols,
+            "atomcoords": self.atomcoords,
+            "scfenergy": self.scfenergy,
+            "afirenergy": self.afirenergy,
+            "zpve": self.zpve,
+            "grads": self.grads,
+            "hessian": self.hessian,
+            "nmeigen": self.nmeigen,
+            "connection": self.connection,
+            "status": self.status,
+        }
+    
+    def _get_extra(self, field):
+        if self._extra is None or field not in self._extra:
+            return _DEFAULTS[field]
+        return self._extra[field]
+    
+    def _set_extra(self, field, value):
+        if value == _DEFAULTS[field]:
+            if self._extra is not None:
+                self._extra.pop(field, None)
+                if not self._extra:
+                    self._extra = None
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[field] = value
+    
     def to_gv(self, path):
         lines = [
             f"# {self.functional}/{self.basis_set}\n",
@@ -54,4 +239,34 @@ class Molecule:
             f.writelines(lines)
 
     def to_grrm(self, path):
-        pass
\ No newline at end of file
+        pass
+
+
+def _intern_symbols(symbols):
+    if not isinstance(symbols, tuple):
+        symbols = tuple(symbols.tolist() if hasattr(symbols, "tolist") else symbols)
+    return _SYMBOLS.setdefault(symbols, symbols)
+
+
+def _lazy(fields, field, decode, lines):
+    """
+    Returns None if field is not in the projection fields (None means all fields).
+    Otherwise the text of lines is kept and decoded with decode(lines) on first access.
+    """
+    if fields is not None and field not in fields:
+        return None
+    return _Lazy(_decode_text, decode, "".join(lines))
+
+
+def _decode_text(decode, text):
+    return decode(text.splitlines(keepends=True))
+
+
+def _check_fields(fields):
+    if fields is None:
+        return None
+    fields = frozenset(fields)
+    unknown = fields.difference(FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+    return fields.intersection(SKIPPABLE_FIELDS)
\ No newline at end of file
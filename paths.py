@@ -0,0 +1,302 @@
+import heapq
+
+import numpy as np
+from scipy import sparse
+from scipy.sparse.csgraph import breadth_first_order, connected_components, minimum_spanning_tree, shortest_path
+
+
+COSTS = ("barrier", "steps")
+
+
+class PathIndex:
+    """
+    Path queries between the EQs of a ReactionPathNetwork.
+    The lowest-barrier path minimises the highest TS energy (scfenergy + zpve) along the path.
+    A minimum spanning tree over the TS energies is built once: every path in it is a lowest-barrier path,
+    and the barrier between two EQs is found from binary-lifting tables in O(log n_eqs).
+    """
+    
+    def __init__(self, network, zpve=True):
+        self.graph = network.graph
+        self.eq_names = self.graph.names.tolist()
+        self.ts_names = self.graph.ts_names.tolist()
+        self._positions = {name: i for i, name in enumerate(self.eq_names)}
+        self.energies = self.graph.edge_energies(zpve)
+        # Python lists of the adjacency for the searches, which visit one neighbour at a time.
+        self._adjacency = (
+            self.graph.indptr.tolist(),
+            self.graph.indices.tolist(),
+            self.graph.edge_ids.tolist(),
+            self.energies.tolist(),
+        )
+        self._build_tree()
+    
+    def _build_tree(self):
+        """
+        Minimum spanning forest over the lowest TS between each pair of EQs, rooted per component,
+        with binary-lifting tables of the ancestors and the highest TS on the way to them.
+        """
+        n = len(self.eq_names)
+        graph = self.graph
+        edges = np.flatnonzero(graph.valid & (graph.source != graph.target))
+        energies = self.energies[edges]
+    
+        # Lowest TS per EQ pair. Weights are shifted to be positive, since csgraph drops zero entries.
+        lo = np.minimum(graph.source[edges], graph.target[edges])
+        hi = np.maximum(graph.source[edges], graph.target[edges])
+        order = np.lexsort((energies, hi, lo))
+        first = np.ones(len(order), dtype=bool)
+        first[1:] = (np.diff(lo[order]) != 0) | (np.diff(hi[order]) != 0)
+        best = order[first]
+        weights = energies[best] - energies.min(initial=0.0) + 1.0
+        forest = minimum_spanning_tree(sparse.csr_matrix((weights, (lo[best], hi[best])), shape=(n, n))).tocoo()
+    
+        # Map the tree entries back to TS ids through the pair keys of the lowest TSs.
+        keys = lo[best] * n + hi[best]
+        key_order = np.argsort(keys)
+        tree_edges = edges[best[key_order[np.searchsorted(keys[key_order], forest.row * n + forest.col)]]]
+    
+        _, self.component = connected_components(forest, directed=False)
+        heads = np.concatenate([forest.row, forest.col])
+        tails = np.concatenate([forest.col, forest.row])
+        via = np.concatenate([tree_edges, tree_edges])
+        order = np.argsort(heads, kind="stable")
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(heads, minlength=n), out=indptr[1:])
+        tails = tails[order]
+        via = via[order]
+        # Symmetric tree with the TS id + 1 of every tree edge, for the searches from a target.
+        self.tree = sparse.csr_matrix((via + 1, (heads[order], tails)), shape=(n, n))
+    
+        # Breadth-first search of all components at once, level by level.
+        self.parent = np.arange(n)
+        self.parent_edge = np.full(n, -1)
+        self.depth = np.full(n, -1)
+        roots = np.unique(self.component, return_index=True)[1]
+        self.depth[roots] = 0
+        frontier = roots
+        level = 0
+        while len(frontier):
+            counts = indptr[frontier + 1] - indptr[frontier]
+            start = np.repeat(indptr[frontier] - (np.cumsum(counts) - counts), counts) + np.arange(counts.sum())
+            heads = np.repeat(frontier, counts)
+            new = self.depth[tails[start]] < 0
+            children = tails[start][new]
+            level += 1
+            self.depth[children] = level
+            self.parent[children] = heads[new]
+            self.parent_edge[children] = via[start][new]
+            frontier = children
+    
+        # up[k][v] is the 2**k-th ancestor of v, top[k][v] the highest TS on the way there (-1 if none).
+        self.up = [self.parent]
+        self.top = [self.parent_edge]
+        for _ in range(max(level, 1).bit_length()):
+            up, top = self.up[-1], self.top[-1]
+            self.up.append(up[up])
+            self.top.append(self._higher(top, top[up]))
+    
+    def _higher(self, a, b):
+        """
+        Elementwise the TS id with the higher energy, where -1 means no TS.
+        """
+        energy_a = np.where(a >= 0, self.energies[a], -np.inf)
+        energy_b = np.where(b >= 0, self.energies[b], -np.inf)
+        return np.where(energy_b > energy_a, b, a)
+    
+    def _position(self, name):
+        try:
+            return self._positions[name]
+        except KeyError:
+            raise KeyError(name) from None
+    
+    def _check_connected(self, u, v):
+        if self.component[u] != self.component[v]:
+            raise ValueError(f"{self.eq_names[u]} and {self.eq_names[v]} are not connected.")
+    
+    def barrier(self, source, target):
+        """
+        Returns the highest TS energy on the lowest-barrier path between two EQs and the name of that TS.
+        The energy is None and the name is None if source and target are the same EQ.
+        """
+        u, v = self._position(source), self._position(target)
+        self._check_connected(u, v)
+    
+        top = -1
+        if self.depth[u] < self.depth[v]:
+            u, v = v, u
+        difference = self.depth[u] - self.depth[v]
+        for k in range(len(self.up)):
+            if difference >> k & 1:
+                top = self._top(top, self.top[k][u])
+                u = self.up[k][u]
+        if u != v:
+            for k in reversed(range(len(self.up))):
+                if self.up[k][u] != self.up[k][v]:
+                    top = self._top(self._top(top, self.top[k][u]), self.top[k][v])
+                    u, v = self.up[k][u], self.up[k][v]
+            top = self._top(self._top(top, self.parent_edge[u]), self.parent_edge[v])
+    
+        if top < 0:
+            return None, None
+        return float(self.energies[top]), self.ts_names[top]
+    
+    def _top(self, a, b):
+        if a < 0 or (b >= 0 and self.energies[b] > self.energies[a]):
+            return int(b)
+        return int(a)
+    
+    def lowest_barrier_path(self, source, target):
+        """
+        Returns the names along a lowest-barrier path, EQs and TSs alternating, e.g. ["EQ0", "TS3", "EQ5"].
+        """
+        u, v = self._position(source), self._position(target)
+        self._check_connected(u, v)
+    
+        up_path = [u]
+        down_path = [v]
+        while u != v:
+            if self.depth[u] >= self.depth[v]:
+                up_path += [~int(self.parent_edge[u]), int(self.parent[u])]
+                u = self.parent[u]
+            else:
+                down_path += [~int(self.parent_edge[v]), int(self.parent[v])]
+                v = self.parent[v]
+        return self._names(up_path[:-1] + down_path[::-1])
+    
+    def _names(self, path):
+        """
+        Names of a path of EQ positions, with TS ids stored as ~id.
+        """
+        return [self.eq_names[i] if i >= 0 else self.ts_names[~i] for i in path]
+    
+    def k_best_paths(self, source, target, k=3, cost="barrier"):
+        """
+        Yen's k best loopless paths. cost is "barrier" (the highest TS energy) or "steps" (the number of TSs).
+        Returns a list of (cost, names) in order of cost, with the names as in lowest_barrier_path.
+        Paths of the same cost come in no particular order.
+        The searches are guided by lower bounds to the target from the spanning tree and a breadth-first search,
+        and deviations whose bound cannot beat the candidates already found are skipped.
+        """
+        if cost not in COSTS:
+            raise ValueError(f"Unknown cost: {cost}")
+        u, v = self._position(source), self._position(target)
+        self._check_connected(u, v)
+        bounds = self._bounds(v, cost)
+    
+        nodes, edges = self._search(u, v, cost, bounds, -np.inf, set(), set())
+        best = [(nodes, edges, 0)]
+        candidates = []
+        seen = {tuple(edges)}
+        while len(best) < k:
+            nodes, edges, deviation = best[-1]
+            needed = k - len(best)
+            highest = max([self.energies[edge] for edge in edges[:deviation]], default=-np.inf)
+            # Lawler: the deviations before this path's own were searched when its parent was accepted.
+            for j in range(deviation, len(edges)):
+                if j > deviation:
+                    highest = max(highest, self.energies[edges[j - 1]])
+                spur_bound = bounds[nodes[j]]
+                bound = max(highest, spur_bound[0]) if cost == "barrier" else j + spur_bound[1]
+                if len(candidates) >= needed and bound >= heapq.nsmallest(needed, candidates)[-1][0]:
+                    continue
+                root_nodes = nodes[:j + 1]
+                banned_edges = {path[1][j] for path in best if path[1][:j] == edges[:j]}
+                spur = self._search(nodes[j], v, cost, bounds, highest, set(root_nodes[:-1]), banned_edges)
+                if spur is None:
+                    continue
+                path = (root_nodes[:-1] + spur[0], edges[:j] + spur[1], j)
+                if tuple(path[1]) not in seen:
+                    seen.add(tuple(path[1]))
+                    heapq.heappush(candidates, (self._cost(path[1], cost), len(path[1]), path))
+            if not candidates:
+                break
+            best.append(heapq.heappop(candidates)[2])
+    
+        results = []
+        for nodes, edges, _ in best:
+            names = [self.eq_names[nodes[0]]]
+            for edge, node in zip(edges, nodes[1:]):
+                names += [self.ts_names[edge], self.eq_names[node]]
+            if cost == "barrier":
+                results.append((self._cost(edges, cost) if edges else None, names))
+            else:
+                results.append((len(edges), names))
+        return results
+    
+    def _cost(self, edges, cost):
+        if cost == "barrier":
+            return float(self.energies[edges].max()) if edges else -np.inf
+        return len(edges)
+    
+    def _bounds(self, target, cost):
+        """
+        Lower bounds (highest TS energy, number of steps) of the paths from every EQ to target, as a list of pairs.
+        The highest TS energy is the barrier along the spanning tree, found for all EQs at once by pointer jumping.
+        """
+        n = len(self.eq_names)
+        hops = shortest_path(self.graph.adjacency_matrix(), indices=target, unweighted=True)
+        if cost != "barrier":
+            return list(zip([0] * n, hops.tolist()))
+    
+        order, predecessors = breadth_first_order(self.tree, target, directed=False, return_predecessors=True)
+        children = order[1:]
+        highest = np.full(n, -np.inf)
+        highest[children] = self.energies[np.asarray(self.tree[children, predecessors[children]]).ravel() - 1]
+        jump = np.where(predecessors >= 0, predecessors, np.arange(n))
+        while np.any(jump != jump[jump]):
+            highest = np.maximum(highest, highest[jump])
+            jump = jump[jump]
+        highest = np.maximum(highest, highest[jump])
+        return list(zip(highest.tolist(), hops.tolist()))
+    
+    def _search(self, source, target, cost, bounds, highest, banned_nodes, banned_edges):
+        """
+        A* search over the CSR adjacency with the lower bounds to target, skipping the banned EQs and TSs.
+        highest is the highest TS energy before source. For the barrier cost, a partial path is keyed by
+        the highest of its TS energies and the bound from its end, which fixes the barrier of every extension,
+        so the search stays exact. Paths of the same key are taken in order of steps and bound, which only
+        shortens the search: the path returned has the lowest barrier, not the fewest steps among those.
+        Returns the node and edge lists of the best path, or None.
+        """
+        indptr, neighbours, edge_ids, energies = self._adjacency
+        barrier = cost == "barrier"
+    
+        key = max(highest, bounds[source][0]) if barrier else 0
+        # The label of a node is its key for the barrier cost and its number of steps for the steps cost.
+        best = {source: key if barrier else 0}
+        previous = {}
+        heap = [(key, bounds[source][1], 0, source)]
+        while heap:
+            key, _, steps, node = heapq.heappop(heap)
+            if node == target:
+                break
+            if (key if barrier else steps) > best[node]:
+                continue
+            for k in range(indptr[node], indptr[node + 1]):
+                edge = edge_ids[k]
+                neighbour = neighbours[k]
+                if neighbour in banned_nodes or edge in banned_edges:
+                    continue
+                bound_key, bound_steps = bounds[neighbour]
+                value = key
+                if barrier:
+                    if energies[edge] > value:
+                        value = energies[edge]
+                    if bound_key > value:
+                        value = bound_key
+                label = value if barrier else steps + 1
+                if neighbour not in best or label < best[neighbour]:
+                    best[neighbour] = label
+                    previous[neighbour] = (node, edge)
+                    heapq.heappush(heap, (value, steps + 1 + bound_steps, steps + 1, neighbour))
+        else:
+            return None
+    
+        nodes = [target]
+        edges = []
+        while nodes[-1] != source:
+            node, edge = previous[nodes[-1]]
+            nodes.append(node)
+            edges.append(edge)
+        return nodes[::-1], edges[::-1]
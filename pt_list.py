@@ -1,103 +1,103 @@
 import re
 
-import numpy as np
+from .cache import _cached_molecules
+from .molecule import Molecule, _check_fields, _lazy
+from ._blocks import _iter_blocks
+from ._follow import _ListFollower
+from ._molecule_list import _MoleculeList
+from ._numeric import _read_coords, _read_floats
+from ._open import _is_compressed, _open_text
+from ._trajectory import _write_gv, _write_xyz
 
-from .data import atomic_number
-from .molecule import Molecule
 
+class PTList(_MoleculeList):
 
-class PTList:
-
-    def __init__(self, name=None, molecules=None):
-        self.name = name
-        self.molecules = molecules
-    
-    def __len__(self):
-        return len(self.molecules)
+    prefix = "PT"
     
-    def __getitem__(self, item):
-        return self.molecules[item]
+    @property
+    def connections(self):
+        """
+        (n_structures, 2) array of the names of the connected EQs.
+        """
+        return self._columns(coords=False).connection
     
     def to_gv(self, path):
-        num = len(self.molecules)
-        lines = [" #p\n", " \n"]
-        
-        for i, molecule in enumerate(self.molecules):
-            lines += [
-                " GradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGrad\n",
-                "                          Input orientation:                          \n",
-                " ---------------------------------------------------------------------\n",
-                " Center     Atomic      Atomic             Coordinates (Angstroms)    \n",
-                " Number     Number       Type             X           Y           Z   \n",
-                " ---------------------------------------------------------------------\n",
-                " ---------------------------------------------------------------------\n",
-                " \n",
-                " GradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGrad\n",
-                f" Step number   1 out of a maximum of   2 on scan point {i+1:5d} out of {num:5d}\n",
-                " \n",
-                " GradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGrad\n",
-                "                          Input orientation:                          \n",
-                " ---------------------------------------------------------------------\n",
-                " Center     Atomic      Atomic             Coordinates (Angstroms)    \n",
-                " Number     Number       Type             X           Y           Z   \n",
-                " ---------------------------------------------------------------------\n",
-                *[
-                    f"{i+1:7d} {atomic_number(sym):10d}           0     {coord[0]:11.6f} {coord[1]:11.6f} {coord[2]:11.6f}\n"
-                    for i, (sym, coord) in enumerate(zip(molecule.symbols, molecule.atomcoords))
-                ],
-                " ---------------------------------------------------------------------\n",
-                f" SCF Done:  E({molecule.functional}) = {molecule.scfenergy:15.12f}     A.U.\n",
-                " \n",
-                " GradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGrad\n",
-                f" Step number   2 out of a maximum of   2 on scan point {i+1:5d} out of {num:5d}\n",
-                " \n",
-            ]
-        
-        lines += [
-            " GradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGradGrad\n",
-            " Normal termination of Gaussian 16\n"
-        ]
-        
-        with open(path, "w") as f:
-            f.writelines(lines)
-
-
-def read_pt_list(path):
+        _write_gv(path, self)
     
-    with open(path, "r") as f:
-        lines = f.readlines()
+    def to_xyz(self, path, extended=False):
+        """
+        Write a multi-frame XYZ file, or extended XYZ with the energies in the comment lines.
+        """
+        _write_xyz(path, self, extended)
     
-    indices_num = [i for i, line in enumerate(lines) if line.startswith("#")]
-    indices_num.append(len(lines))
-    molecules = []
+    def _read_block(self, lines):
+        return _read_pt_block(lines, self._fields)
+
+
+class PTListFollower(_ListFollower):
+    """
+    Follow a _TS_list.log or _PT_list.log that is still being written. poll() returns the newly added structures.
+    """
     
-    for i, j in zip(indices_num, indices_num[1:]):
-        lines_pt = lines[i:j]
-        name = "PT" + re.search(r"TS (\d+),", lines_pt[0]).group(1)
-        index_energy = [i for i, line in enumerate(lines_pt) if line.startswith("Energy")][0]
-        lines_coord = lines_pt[1:index_energy]
-        symbols = [line.split()[0] for line in lines_coord]
-        atomcoords = np.array([list(map(float, line.split()[1:4])) for line in lines_coord])
-        scfenergy = float(re.search(r"\(\s*(-?\d+\.?\d+)\s*:", lines_pt[index_energy]).group(1))
-        afirenergy = float(re.search(r"=\s*(-?\d+\.?\d+)\s*\(", lines_pt[index_energy]).group(1))
-        mult = float(re.search(r"=\s*(-?\d+\.?\d+)", lines_pt[index_energy + 1]).group(1))
-        zpve = float(re.search(r"=\s*(-?\d+\.?\d+)", lines_pt[index_energy + 2]).group(1))
-        index_connection = [i for i, line in enumerate(lines_pt) if line.startswith("CONNECTION")][0]
-        lines_nmeigen = lines_pt[index_energy + 4:index_connection]
-        nmeigen = np.concatenate([list(map(float, line.split())) for line in lines_nmeigen])
-        connection = re.search(r":\s*(\d+|\?\?)\s*-\s*(\d+|\?\?)", lines_pt[index_connection]).groups()
-        connection = tuple(f"EQ{num}" for num in connection)
-        molecule = Molecule(
-            name=name,
-            mult=mult,
-            symbols=symbols,
-            atomcoords=atomcoords,
-            scfenergy=scfenergy,
-            afirenergy=afirenergy,
-            zpve=zpve,
-            nmeigen=nmeigen,
-            connection=connection,
-        )
-        molecules.append(molecule)
+    def _complete(self, lines):
+        """
+        The last structure is complete when its CONNECTION line has been written.
+        """
+        return any(line.startswith("CONNECTION") for line in lines)
     
-    return PTList(name=path, molecules=molecules)
\ No newline at end of file
+    def _read_block(self, lines):
+        return _read_pt_block(lines, self._fields)
+
+
+def _read_pt_block(lines_pt, fields=None):
+    name = "PT" + re.search(r"(?:TS|PT) (\d+),", lines_pt[0]).group(1)
+    index_energy = [i for i, line in enumerate(lines_pt) if line.startswith("Energy")][0]
+    lines_coord = lines_pt[1:index_energy]
+    symbols, atomcoords = _read_coords(lines_coord)
+    scfenergy = float(re.search(r"\(\s*(-?\d+\.?\d+)\s*:", lines_pt[index_energy]).group(1))
+    afirenergy = float(re.search(r"=\s*(-?\d+\.?\d+)\s*\(", lines_pt[index_energy]).group(1))
+    mult = float(re.search(r"=\s*(-?\d+\.?\d+)", lines_pt[index_energy + 1]).group(1))
+    zpve = float(re.search(r"=\s*(-?\d+\.?\d+)", lines_pt[index_energy + 2]).group(1))
+    index_connection = [i for i, line in enumerate(lines_pt) if line.startswith("CONNECTION")][0]
+    lines_nmeigen = lines_pt[index_energy + 4:index_connection]
+    nmeigen = _lazy(fields, "nmeigen", _read_floats, lines_nmeigen)
+    connection = re.search(r":\s*(\d+|\?\?)\s*-\s*(\d+|\?\?)", lines_pt[index_connection]).groups()
+    connection = tuple(f"EQ{num}" for num in connection)
+    return Molecule(
+        name=name,
+        mult=mult,
+        symbols=symbols,
+        atomcoords=atomcoords,
+        scfenergy=scfenergy,
+        afirenergy=afirenergy,
+        zpve=zpve,
+        nmeigen=nmeigen,
+        connection=connection,
+    )
+
+
+def iter_pt_list(path, fields=None):
+    """
+    Yield one Molecule per "# Geometry of ..." block, reading the file incrementally.
+    nmeigen is decoded on first access. fields lists the fields to keep, but only nmeigen can be left out:
+    e.g. fields=("name", "scfenergy", "atomcoords") skips the eigenvalues and still parses every other field.
+    """
+    fields = _check_fields(fields)
+    with _open_text(path) as f:
+        for lines_pt in _iter_blocks(f):
+            yield _read_pt_block(lines_pt, fields)
+
+
+def read_pt_list(path, index=False, cache=None, fields=None):
+    """
+    path may be compressed (.gz, .xz, .bz2, .zst) and is then decompressed while it is parsed.
+    With index=True, only the byte offsets of the blocks are scanned (and saved to a sidecar
+    "<path>.idx.npz" for reuse) and each structure is parsed when it is accessed (ignored for compressed files).
+    cache is a ParseCache, None for the one set by enable_cache (if any) or False for no cache.
+    fields is passed to iter_pt_list.
+    """
+    fields = _check_fields(fields)
+    if index and not _is_compressed(path):
+        return PTList.from_index(path, fields=fields)
+    molecules = _cached_molecules("pt_list", path, cache, lambda: list(iter_pt_list(path, fields)), fields)
+    return PTList.from_molecules(molecules, name=path)
\ No newline at end of file
@@ -4,25 +4,94 @@ import numpy as np
 from matplotlib.colors import LinearSegmentedColormap, Normalize
 from pyvis.network import Network
 
-from .geometry import get_adj_matrix
+from .eq_list import EQList
+from .graph import ReactionGraph
+from .kinetics import Kinetics
+from .paths import PathIndex
+from .pt_list import PTList
+from ._archived import _Archived
+from ._bond_changes import _bond_changes
+from ._html import _write_html
+from ._molecule_list import _MoleculeList
 
 
-class ReactionPathNetwork:
+class ReactionPathNetwork(_Archived):
     
     def __init__(self, eq_list, pt_list):
-        self.eq_list = eq_list
-        self.pt_list = pt_list
-        
-        G = nx.MultiGraph()
-        nodes = [(eq.name, eq.__dict__) for eq in eq_list]
-        G.add_nodes_from(nodes)
-        edges = [(*pt.connection, pt.__dict__) for pt in pt_list]
-        G.add_edges_from(edges)
-        if "EQ??" in G:
-            G.remove_node("EQ??")
-        self.rpn = G
+        # Plain lists of molecules are held in an EQList and a PTList.
+        self.eq_list = eq_list if isinstance(eq_list, _MoleculeList) else EQList(molecules=list(eq_list))
+        self.pt_list = pt_list if isinstance(pt_list, _MoleculeList) else PTList(molecules=list(pt_list))
+        self._rpn = None
+        self._graph = None
     
-    def to_html(self, path):
+    @property
+    def graph(self):
+        """
+        Array-backed ReactionGraph of the EQs and TSs, built on first access. See grrmlib.graph.ReactionGraph.
+        """
+        if self._graph is None:
+            self._graph = ReactionGraph(self.eq_list, self.pt_list)
+        return self._graph
+    
+    @property
+    def rpn(self):
+        """
+        networkx.MultiGraph of the EQs (nodes) and TSs (edges), built on first access from graph.
+        """
+        if self._rpn is None:
+            self._rpn = self.graph.to_networkx()
+        return self._rpn
+    
+    def add(self, eqs=(), pts=()):
+        """
+        Grow the network, e.g. with the molecules returned by EQListFollower.poll() and PTListFollower.poll().
+        graph and rpn are rebuilt on their next access, so that a TS to an EQ that only arrives later is added with it.
+        """
+        self.eq_list.extend(list(eqs))
+        self.pt_list.extend(list(pts))
+        self._graph = None
+        self._rpn = None
+    
+    def bond_changes(self, threshold=1.25):
+        """
+        Bonds formed and broken over every TS, from connection[0] to connection[1], computed for all TSs at once.
+        Returns a dict of columns "ts", "eq0", "eq1", "atom0", "atom1" (1-based labels) and "change" (1 formed, -1 broken).
+        TSs connected to an EQ that is not in eq_list, e.g. "EQ??", are skipped.
+        """
+        pairs, offsets = self.eq_list.bonds(threshold)
+        n_atoms = len(self.eq_list.store.symbols)
+        graph = self.graph
+        ts = np.flatnonzero(graph.valid)
+        
+        step, i, j, change = _bond_changes(pairs, offsets, n_atoms, graph.source[ts], graph.target[ts])
+        ts = ts[step]
+        return {
+            "ts": graph.ts_names[ts],
+            "eq0": graph.names[graph.source[ts]],
+            "eq1": graph.names[graph.target[ts]],
+            "atom0": i + 1,
+            "atom1": j + 1,
+            "change": change,
+        }
+    
+    def kinetics(self, temperature=298.15, zpve=True):
+        """
+        Master-equation kinetics of the network with Eyring rates, see grrmlib.kinetics.Kinetics.
+        """
+        return Kinetics(self, temperature, zpve)
+    
+    def paths(self, zpve=True):
+        """
+        Index for lowest-barrier and k-best path queries between EQs, see grrmlib.paths.PathIndex.
+        Built once from the current EQs and TSs; build a new one after add().
+        """
+        return PathIndex(self, zpve)
+    
+    def to_html(self, path, grouping="labelled"):
+        """
+        grouping is passed to group_by_connectivity as the method:
+        "labelled" (the same bonded atom pairs), "hash" or "exact" (the same bond graph whatever the atom order).
+        """
         # Creat another graph H for visualization.
         H = self.rpn.copy()
         
@@ -50,22 +119,13 @@ class ReactionPathNetwork:
             H, {n: {"color": energy2color(data["scfenergy_adjusted"], cmap, norm)} for n, data in H.nodes(data=True)}
         )
         
-        groups = {}  # dict of dict
+        # Group the EQs by bonding pattern, see _MoleculeList.group_by_connectivity.
+        groups = self.eq_list.group_by_connectivity(method=grouping)
+        for k, group in enumerate(groups):
+            for nth, node in enumerate(node for node in group if node in H):
+                H.nodes[node]["group"] = f"G{k}"
+                H.nodes[node]["group_nth"] = nth
         
-        for node, data in H.nodes(data=True):
-            arr_adj = get_adj_matrix(data["symbols"], data["atomcoords"])
-            for key, value in groups.items():
-                if np.all(value["adj_matrix"] == arr_adj):
-                    value["group_nth"] += 1
-                    H.nodes[node]["group"] = key
-                    H.nodes[node]["group_nth"] = value["group_nth"]
-                    break
-            else:
-                key = f"G{len(groups)}"
-                H.nodes[node]["group"] = key
-                H.nodes[node]["group_nth"] = 0
-                groups[key] = ({"group_nth": 0, "adj_matrix":arr_adj})
-
         n_groups = len(groups)
         nx.set_node_attributes(
             H, {
@@ -210,4 +270,83 @@ class ReactionPathNetwork:
         
         net.toggle_physics(False)
         net.set_edge_smooth("dynamic")
-        net.show(str(path))
\ No newline at end of file
+        net.show(str(path))
+    
+    def to_html_stream(self, path, layout="groups", grouping="labelled", compact=False):
+        """
+        Write the network as a vis.js page in one pass from the arrays of graph, for networks too large for to_html.
+        Colours follow to_html: scfenergy relative to EQ0 (or the lowest EQ if there is no EQ0) in kJ/mol,
+        mapped onto cividis from -100 to 0. layout is "groups" (the rings of to_html, with grouping passed
+        to group_by_connectivity), "circle" (the ring of to_html2) or an (n_eqs, 2) array of positions.
+        With compact=True, coordinates, colours and connections are embedded as base64 typed arrays,
+        which keeps the file small and quick to load for tens of thousands of EQs.
+        """
+        graph = self.graph
+        n = graph.n_nodes
+        edges = np.flatnonzero(graph.valid)
+        source = graph.source[edges]
+        target = graph.target[edges]
+        
+        # Colours of all EQs and TSs in one colormap call.
+        energies = graph.node_energies(zpve=False)
+        try:
+            reference = energies[graph.position("EQ0")]
+        except KeyError:
+            reference = energies.min(initial=0.0)
+        relative = (np.concatenate([energies, graph.edge_energies(zpve=False)[edges]]) - reference) * 2625.5
+        colors = plt.cm.cividis(Normalize(-100, 0)(relative), bytes=True)[:, :3]
+        
+        extra_nodes = []
+        if isinstance(layout, str) and layout == "groups":
+            groups = self.eq_list.group_by_connectivity(method=grouping)
+            n_groups = len(groups)
+            sizes = np.array([len(group) for group in groups], dtype=np.int64)
+            members = graph.positions(np.array([name for group in groups for name in group], dtype=str))
+            group = np.repeat(np.arange(n_groups), sizes)
+            nth = np.arange(len(members)) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+            radius = np.zeros(n)
+            angle = np.zeros(n)
+            radius[members] = 10 * n_groups + 100 * (nth + 1)
+            angle[members] = 2 * np.pi * group / max(n_groups, 1)
+            xy = np.stack([radius * np.cos(angle), -radius * np.sin(angle)], axis=1)
+            for i in range(n_groups):
+                extra_nodes.append({
+                    "id": f"G{i}" if not compact else n + i,
+                    "label": f"G{i}",
+                    "title": f"G{i}",
+                    "shape": "circle",
+                    "color": {"background": "rgba(0,0,0,0)", "border": "black"},
+                    "x": 10 * n_groups * np.cos(2 * np.pi * i / n_groups),
+                    "y": - 10 * n_groups * np.sin(2 * np.pi * i / n_groups),
+                })
+        elif isinstance(layout, str) and layout == "circle":
+            angle = 2 * np.pi * np.arange(n) / max(n, 1)
+            xy = np.stack([10 * n * np.cos(angle), -10 * n * np.sin(angle)], axis=1)
+        elif isinstance(layout, str):
+            raise ValueError(f"Unknown layout: {layout}")
+        else:
+            xy = np.asarray(layout, dtype=float).reshape(n, 2)
+        
+        # Parallel TSs between the same two EQs are numbered in order, and curve more the later they come.
+        lo = np.minimum(source, target)
+        hi = np.maximum(source, target)
+        order = np.lexsort((edges, hi, lo))
+        start = np.ones(len(order), dtype=bool)
+        start[1:] = (np.diff(lo[order]) != 0) | (np.diff(hi[order]) != 0)
+        first = np.maximum.accumulate(np.where(start, np.arange(len(order)), 0))
+        parallel = np.empty(len(order), dtype=np.int64)
+        parallel[order] = np.arange(len(order)) - first
+        
+        _write_html(
+            path,
+            graph.names.tolist(),
+            xy,
+            colors[:n],
+            graph.ts_names[edges].tolist(),
+            source,
+            target,
+            colors[n:],
+            parallel,
+            extra_nodes,
+            compact,
+        )
\ No newline at end of file
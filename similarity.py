@@ -0,0 +1,145 @@
+import numpy as np
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+from scipy.spatial import cKDTree
+
+from .alignment import get_rmsd
+from .data import symbols_to_z
+
+
+DESCRIPTORS = ("coulomb", "histogram")
+
+# Distance histogram bins in Å of the "histogram" descriptor.
+BINS = np.linspace(0, 10, 101)
+
+# Number of distance matrix elements computed at once when fingerprinting a coordinate stack.
+_CHUNK_ELEMENTS = 1 << 22
+
+
+def get_fingerprints(symbols, coords, descriptor="coulomb", bins=BINS):
+    """
+    Rotation- and permutation-invariant fingerprints of a (F, n, 3) stack of structures with the same symbols.
+    "coulomb" gives the Coulomb matrix eigenvalues in descending order (F, n),
+    "histogram" the counts of the pair distances in bins (F, len(bins) - 1).
+    """
+    if descriptor not in DESCRIPTORS:
+        raise ValueError(f"Unknown descriptor: {descriptor}")
+    z = symbols_to_z(symbols).astype(float)
+    coords = np.asarray(coords, dtype=float)
+    n_atoms = len(z)
+    n_bins = len(bins) - 1
+    
+    i, j = np.triu_indices(n_atoms, 1)
+    step = max(1, _CHUNK_ELEMENTS // max(n_atoms * n_atoms, 1))
+    chunks = [np.empty((0, n_atoms if descriptor == "coulomb" else n_bins))]
+    for start in range(0, len(coords), step):
+        chunk = coords[start:start + step]
+        distances = np.linalg.norm(chunk[:, i] - chunk[:, j], axis=-1)
+        if descriptor == "coulomb":
+            coulomb = np.zeros((len(chunk), n_atoms, n_atoms))
+            coulomb[:, i, j] = z[i] * z[j] / distances
+            coulomb[:, j, i] = coulomb[:, i, j]
+            coulomb[:, np.arange(n_atoms), np.arange(n_atoms)] = 0.5 * z ** 2.4
+            chunks.append(np.linalg.eigvalsh(coulomb)[:, ::-1])
+        else:
+            index = np.searchsorted(bins, distances, side="right") - 1
+            inside = (index >= 0) & (index < n_bins)
+            index = index + np.arange(len(chunk))[:, None] * n_bins
+            counts = np.bincount(index[inside], minlength=len(chunk) * n_bins)
+            chunks.append(counts.reshape(len(chunk), n_bins).astype(float))
+    return np.concatenate(chunks)
+
+
+class FingerprintIndex:
+    """
+    KD-tree over the fingerprints of an EQList, PTList or list of molecules, for near-duplicate search.
+    Structures with different numbers of atoms are compared with their Coulomb eigenvalues padded by zeros.
+    """
+    
+    def __init__(self, molecules, descriptor="coulomb", bins=BINS):
+        self.molecules = molecules
+        self.descriptor = descriptor
+        self.bins = np.asarray(bins, dtype=float)
+    
+        try:
+            store = molecules.store
+        except (AttributeError, ValueError):
+            store = None
+    
+        if store is not None:
+            self.names = store.names.tolist()
+            self.fingerprints = get_fingerprints(store.symbols, store.coords, descriptor, self.bins)
+        else:
+            self.names = [molecule.name for molecule in molecules]
+            rows = [self._fingerprint(molecule) for molecule in molecules]
+            width = max((len(row) for row in rows), default=0)
+            self.fingerprints = np.array([np.pad(row, (0, width - len(row))) for row in rows]).reshape(len(rows), width)
+        self.tree = cKDTree(self.fingerprints)
+    
+    def __len__(self):
+        return len(self.names)
+    
+    def fingerprint(self, molecule):
+        """
+        Fingerprint of molecule, padded or cut to the width of the index.
+        """
+        row = self._fingerprint(molecule)
+        width = self.fingerprints.shape[1]
+        return np.pad(row, (0, width - len(row))) if len(row) < width else row[:width]
+    
+    def query(self, molecule, k=1):
+        """
+        Returns the fingerprint distances and the names of the k nearest structures.
+        """
+        distances, positions = self.tree.query(self.fingerprint(molecule), k=k)
+        distances = np.atleast_1d(distances)
+        positions = np.atleast_1d(positions)
+        found = positions < len(self)
+        return distances[found], [self.names[i] for i in positions[found]]
+    
+    def query_radius(self, molecule, r):
+        """
+        Returns the fingerprint distances and the names of the structures within r, nearest first.
+        """
+        fingerprint = self.fingerprint(molecule)
+        positions = np.array(self.tree.query_ball_point(fingerprint, r), dtype=int)
+        distances = np.linalg.norm(self.fingerprints[positions] - fingerprint, axis=1)
+        order = np.argsort(distances, kind="stable")
+        return distances[order], [self.names[i] for i in positions[order]]
+    
+    def clusters(self, threshold, rmsd=None):
+        """
+        Groups the structures whose fingerprints are within threshold, chained (single linkage), as lists of positions.
+        With rmsd, a pair must also be within that RMSD (Å) after alignment with atom permutation.
+        Only the pairs found by the KD-tree are compared, so the cost follows the number of near pairs, not N².
+        """
+        pairs = self.tree.query_pairs(threshold, output_type="ndarray")
+        if rmsd is not None and len(pairs):
+            keep = [_permuted_rmsd(self.molecules[i], self.molecules[j]) <= rmsd for i, j in pairs.tolist()]
+            pairs = pairs[np.array(keep, dtype=bool)]
+    
+        graph = coo_matrix((np.ones(len(pairs)), (pairs[:, 0], pairs[:, 1])), shape=(len(self), len(self)))
+        _, labels = connected_components(graph, directed=False)
+        groups = {}
+        for i, label in enumerate(labels.tolist()):
+            groups.setdefault(label, []).append(i)
+        return list(groups.values())
+    
+    def _fingerprint(self, molecule):
+        return get_fingerprints(molecule.symbols, np.asarray(molecule.atomcoords)[None], self.descriptor, self.bins)[0]
+
+
+def _permuted_rmsd(a, b):
+    """
+    RMSD with atom permutation between two molecules that may list their atoms in different orders.
+    """
+    if sorted(a.symbols) != sorted(b.symbols):
+        return np.inf
+    order_a = np.argsort(np.asarray(a.symbols), kind="stable")
+    order_b = np.argsort(np.asarray(b.symbols), kind="stable")
+    return get_rmsd(
+        np.asarray(a.atomcoords, dtype=float)[order_a],
+        np.asarray(b.atomcoords, dtype=float)[order_b],
+        np.asarray(a.symbols)[order_a],
+        permute=True,
+    )
@@ -0,0 +1,36 @@
+"""
+Checks of LUPTS.bond_switches on a LUP log whose backward end-point optimization did not converge,
+so that the first IRC frame has no coordinates. One O-H bond is stretched in the last forward step.
+
+Run from the directory containing the package:
+    python -m pytest grrmlib/tests
+"""
+import os
+
+import numpy as np
+
+from grrmlib import read_lup_ts
+
+
+DATA = os.path.join(os.path.dirname(__file__), "data")
+
+
+def test_bond_switches_skip_frames_without_coordinates():
+    lup = read_lup_ts(os.path.join(DATA, "job_LUP1.log"), cache=False)
+    assert lup.irc[0].atomcoords is None
+    
+    switches = lup.bond_switches()
+    np.testing.assert_array_equal(switches["frame"], [6, 7])
+    assert switches["name"].tolist() == ["STEP3", "Optimized structure"]
+    np.testing.assert_array_equal(switches["atom0"], [1, 1])
+    np.testing.assert_array_equal(switches["atom1"], [2, 2])
+    np.testing.assert_array_equal(switches["change"], [-1, 1])
+
+
+def test_bond_switches_reverse_skip_frames_without_coordinates():
+    lup = read_lup_ts(os.path.join(DATA, "job_LUP1.log"), cache=False)
+    
+    switches = lup.bond_switches(reverse=True)
+    np.testing.assert_array_equal(switches["frame"], [1, 2])
+    assert switches["name"].tolist() == ["STEP3", "STEP2"]
+    np.testing.assert_array_equal(switches["change"], [-1, 1])
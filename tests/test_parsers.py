@@ -0,0 +1,87 @@
+"""
+Checks that the readers give the same molecules as the original line-by-line parsers on small synthetic outputs:
+EQ and TS lists, a MIN log with an optimized structure and Hessian, one whose optimization did not converge, and a LUP log.
+data/expected.json holds every field of the molecules as parsed by the original parsers, with the Hessians as their lower triangle.
+
+Run from the directory containing the package:
+    python -m pytest grrmlib/tests
+"""
+import json
+import os
+
+import numpy as np
+import pytest
+
+from grrmlib import read_eq_list, read_lup_ts, read_min, read_pt_list
+
+
+DATA = os.path.join(os.path.dirname(__file__), "data")
+
+FIELDS = (
+    "name",
+    "functional",
+    "basis_set",
+    "comments",
+    "charge",
+    "mult",
+    "symbols",
+    "atomcoords",
+    "scfenergy",
+    "afirenergy",
+    "zpve",
+    "grads",
+    "hessian",
+    "nmeigen",
+    "connection",
+    "status",
+)
+
+READERS = {
+    "job_EQ_list.log": lambda path: list(read_eq_list(path, cache=False)),
+    "job_TS_list.log": lambda path: list(read_pt_list(path, cache=False)),
+    "job_MIN0.log": lambda path: _min_molecules(read_min(path, cache=False)),
+    "job_MIN1.log": lambda path: _min_molecules(read_min(path, cache=False)),
+    "job_LUP0.log": lambda path: read_lup_ts(path, cache=False).irc,
+}
+
+
+with open(os.path.join(DATA, "expected.json")) as f:
+    EXPECTED = json.load(f)
+
+
+def _min_molecules(result):
+    return result.itrs + [result.optimized]
+
+
+def _plain(molecule):
+    """
+    The fields of molecule as JSON values, in the layout of expected.json.
+    """
+    fields = {}
+    for field in FIELDS:
+        value = getattr(molecule, field)
+        if field == "hessian" and value is not None:
+            value = np.asarray(value)[np.tril_indices(len(value))]
+        if isinstance(value, np.ndarray):
+            value = value.tolist()
+        elif isinstance(value, (list, tuple)):
+            value = [str(item) for item in value]
+        elif isinstance(value, np.generic):
+            value = value.item()
+        fields[field] = value
+    return fields
+
+
+@pytest.mark.parametrize("file_name", sorted(READERS))
+def test_readers_match_original_parsers(file_name):
+    molecules = READERS[file_name](os.path.join(DATA, file_name))
+    assert [_plain(molecule) for molecule in molecules] == EXPECTED[file_name]
+
+
+@pytest.mark.parametrize("file_name", ["job_EQ_list.log", "job_TS_list.log"])
+def test_indexed_lists_match_original_parsers(file_name, tmp_path):
+    path = tmp_path / file_name
+    path.write_bytes(open(os.path.join(DATA, file_name), "rb").read())
+    read = read_eq_list if file_name == "job_EQ_list.log" else read_pt_list
+    molecules = list(read(str(path), index=True))
+    assert [_plain(molecule) for molecule in molecules] == EXPECTED[file_name]
@@ -0,0 +1,63 @@
+"""
+Checks of PathIndex.k_best_paths against all simple paths of small random networks.
+
+Run from the directory containing the package:
+    python -m pytest grrmlib/tests
+"""
+import networkx as nx
+import numpy as np
+import pytest
+
+from grrmlib.benchmarks.bench_paths import make_network
+
+
+K = 5
+
+
+def _simple_paths(index, source, target):
+    """
+    TS ids of every loopless path between two EQs.
+    """
+    G = nx.MultiGraph()
+    G.add_nodes_from(range(len(index.eq_names)))
+    for e, (a, b) in enumerate(zip(index.graph.source.tolist(), index.graph.target.tolist())):
+        if a >= 0 and b >= 0 and a != b:
+            G.add_edge(a, b, key=e)
+    return [[key for _, _, key in path] for path in nx.all_simple_edge_paths(G, source, target)]
+
+
+def _check_path(index, names, source, target):
+    eqs = [index.eq_names.index(name) for name in names[::2]]
+    tss = [index.ts_names.index(name) for name in names[1::2]]
+    assert eqs[0] == source and eqs[-1] == target
+    assert len(set(eqs)) == len(eqs)
+    for a, b, e in zip(eqs, eqs[1:], tss):
+        assert {a, b} == {int(index.graph.source[e]), int(index.graph.target[e])}
+    return tss
+
+
+@pytest.mark.parametrize("cost", ["barrier", "steps"])
+@pytest.mark.parametrize("seed", range(20))
+def test_k_best_paths(seed, cost):
+    rng = np.random.default_rng(seed)
+    n_eqs = int(rng.integers(3, 8))
+    index = make_network(n_eqs, int(rng.integers(n_eqs, 3 * n_eqs + 1)), seed).paths()
+    
+    for source in range(n_eqs):
+        for target in range(n_eqs):
+            if source == target or index.component[source] != index.component[target]:
+                continue
+            if cost == "barrier":
+                expected = sorted(float(index.energies[edges].max()) for edges in _simple_paths(index, source, target))
+            else:
+                expected = sorted(len(edges) for edges in _simple_paths(index, source, target))
+            
+            results = index.k_best_paths(index.eq_names[source], index.eq_names[target], k=K, cost=cost)
+            assert [value for value, _ in results] == expected[:K]
+            
+            found = set()
+            for value, names in results:
+                tss = _check_path(index, names, source, target)
+                assert value == (float(index.energies[tss].max()) if cost == "barrier" else len(tss))
+                found.add(tuple(tss))
+            assert len(found) == len(results)